@@ -1,8 +1,15 @@
 import logging
 import sys
 
-from pytransifex.api import Transifex
-
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 
 VERSION = "2.dev"
+
+
+def __getattr__(name: str):
+    # The client and its SDK are only imported when asked for, see 'pytransifex.cli'
+    if name == "Transifex":
+        from pytransifex.api import Transifex
+
+        return Transifex
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,53 @@
 import logging
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import nullcontext
+from functools import partial, wraps
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any, Optional
+from threading import BoundedSemaphore
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-import requests
 from transifex.api import transifex_api as tx_api
-from transifex.api.jsonapi.exceptions import DoesNotExist
+from transifex.api.jsonapi.exceptions import DoesNotExist, JsonApiException
 from transifex.api.jsonapi.resources import Resource
 
 from pytransifex.config import ApiConfig
+from pytransifex.exceptions import TransifexException
+from pytransifex.instrumentation import Instrumentation, Stats
 from pytransifex.interfaces import Tx
-from pytransifex.utils import concurrently, ensure_login
+from pytransifex.jobs import (
+    JobCoordinator,
+    download_outcome,
+    submit_download,
+    submit_upload,
+    upload_outcome,
+)
+from pytransifex.languages import language_key, normalize_language_code, registry
+from pytransifex.po import compile_mo, read_po
+from pytransifex.results import PushedResource, PushResult
+from pytransifex.state import (
+    Journal,
+    MetadataCache,
+    PullState,
+    PushManifest,
+    TranslationStore,
+    file_digest,
+)
+from pytransifex.utils import (
+    ExpiringCache,
+    RateLimiter,
+    concurrently,
+    default_max_workers,
+    ensure_login,
+    pooled_session,
+    stream_to_file,
+    with_retries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +68,36 @@ class Client(Tx):
         self.i18n_type = config.i18n_type
         self.logged_in = False
 
+        # Scheduling of concurrent calls, see 'run_concurrently' and 'limit'
+        self.retries = config.retries
+        self.limit(config.max_workers, config.requests_per_second)
+
+        # Polling of asynchronous jobs, see 'JobCoordinator'
+        self.poll_interval = config.poll_interval
+        self.max_poll_interval = config.max_poll_interval
+
+        # Per-phase timings and counters of the work done, see 'Instrumentation'
+        self.instrumentation = Instrumentation()
+
+        # Memoized lookups, see 'invalidate'
+        self.project_index = ExpiringCache(config.cache_ttl)
+        self.resource_index = ExpiringCache(config.cache_ttl)
+        self.language_index = ExpiringCache(config.cache_ttl)
+        self.project_languages = ExpiringCache(config.cache_ttl)
+        self.source_strings = ExpiringCache(config.cache_ttl)
+        self.metadata: MetadataCache | None = None
+        if config.path_to_metadata_cache:
+            self.use_metadata_cache(
+                config.path_to_metadata_cache, ttl=config.metadata_ttl
+            )
+        self.store: TranslationStore | None = None
+        if config.path_to_store:
+            self.use_store(config.path_to_store)
+
+        # Languages are resolved from the catalog shared by the process, see 'get_language'
+        self.path_to_language_cache = config.path_to_language_cache
+        self.language_ttl = config.language_ttl
+
         if not defer_login:
             self.login()
 
@@ -37,16 +105,89 @@ class Client(Tx):
         if self.logged_in:
             return
 
-        # Authentication
-        tx_api.setup(host=self.host, auth=self.api_token)
+        # Authentication only: projects are looked up one by one, when needed (see 'get_project')
+        with self.instrumentation.phase("login"):
+            tx_api.setup(host=self.host, auth=self.api_token)
+            self.instrumentation.attach(tx_api)
+            self.bound_requests(tx_api)
+            self.organization = tx_api.Organization(id=f"o:{self.organization_name}")
         self.logged_in = True
-
-        # Saving organization and projects to avoid round-trips
-        organization = tx_api.Organization.get(slug=self.organization_name)
-        self.projects = organization.fetch("projects")
-        self.organization = organization
         logger.info(f"Logged in as organization: {self.organization_name}")
 
+    def limit(
+        self, max_workers: int | None = None, requests_per_second: float | None = None
+    ):
+        """
+        Bound the requests of the client, whichever operations and threads make them: at most 'max_workers'
+        in flight at once (Python's default pool size if None), and 'requests_per_second' on average (unlimited if None).
+        Operations run at once, such as the projects of 'pytx sync', thus share these bounds.
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = (
+            RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        # Held by each request while it runs, after waiting for the rate limiter, see 'bound_requests' and 'download'
+        self.slots = BoundedSemaphore(max_workers or default_max_workers())
+        # Translated files are downloaded from a CDN, through a single pool of keep-alive connections, one per slot
+        self.session = pooled_session(max_workers)
+
+    def bound_requests(self, api: Any):
+        """
+        Have each HTTP request of the SDK's API connection wait for the client's rate limiter, then hold one of
+        its slots while it runs, so that the pools of concurrent operations can't exceed these bounds.
+        """
+        request = api.request
+
+        @wraps(request)
+        def bounded_request(*args, **kwargs):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            with self.slots:
+                return request(*args, **kwargs)
+
+        api.request = bounded_request
+
+    def use_metadata_cache(
+        self, path_to_cache: str | Path, ttl: float | None = 3600.0, refresh=False
+    ):
+        """
+        Keep the metadata looked up by this client in the given file, and look it up there first.
+        With 'refresh', what the file holds is discarded and fetched again.
+        """
+        self.metadata = MetadataCache(path_to_cache, ttl)
+        if refresh:
+            self.metadata.clear()
+
+    def use_store(self, path_to_store: str | Path | None):
+        """Keep a copy of the translations pulled in the given directory (none if None), and take them from there when unchanged"""
+        self.store = TranslationStore(path_to_store) if path_to_store else None
+
+    def remember(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        dump: Callable[[Any], Any] = lambda value: value,
+        load: Callable[[Any], Any] = lambda data: data,
+    ) -> Any:
+        """
+        Value found under 'key' in the metadata cache, if any; otherwise fetched and stored there.
+        'dump' and 'load' convert the value to and from JSON.
+        """
+        if self.metadata and (data := self.metadata.get(key)) is not None:
+            return load(data)
+
+        with self.instrumentation.phase("metadata", key=key):
+            value = fetch()
+
+        if self.metadata is None:
+            return value
+        if value is not None:
+            self.metadata.set(key, dump(value))
+        return value
+
+    def metadata_key(self, kind: str, project_slug: str) -> str:
+        return f"{kind}/{self.organization_name}/{project_slug}"
+
     @ensure_login
     def create_project(
         self,
@@ -61,7 +202,7 @@ class Client(Tx):
         logger.info(
             f"Trying to create project from these arguments: project_slug = {project_slug}, "
         )
-        source_language = tx_api.Language.get(code=source_language_code)
+        source_language = self.get_language(source_language_code)
         project_name = project_name or project_slug
 
         tx_api.Project.create(
@@ -73,44 +214,166 @@ class Client(Tx):
             **kwargs,
         )
 
+        self.invalidate(project_slug)
         logger.info(f"Project created with name '{project_name}' !")
 
     @ensure_login
     def delete_project(self, project_slug: str):
         if project := self.get_project(project_slug=project_slug):
             project.delete()
+            self.invalidate(project_slug)
             logger.info(f"Deleted project: {project_slug}")
 
-    @ensure_login
-    def get_project(self, project_slug: str) -> None | Resource:
-        """Fetches the project matching the given slug"""
-        if self.projects:
+    def invalidate(self, project_slug: str | None = None):
+        """
+        Forget the memoized resources and languages of the given project,
+        or everything memoized (including the language catalogue) if no project is given.
+        """
+        if project_slug:
+            self.project_index.pop(project_slug)
+            self.resource_index.pop(project_slug)
+            self.project_languages.pop(project_slug)
+            if self.metadata:
+                self.metadata.pop(
+                    *(
+                        self.metadata_key(kind, project_slug)
+                        for kind in ["project", "resources", "languages"]
+                    )
+                )
+        else:
+            self.project_index.clear()
+            self.resource_index.clear()
+            self.project_languages.clear()
+            self.language_index.clear()
+            registry.clear()
+            if self.metadata:
+                self.metadata.clear()
+
+    def refreshing(
+        self,
+        project_slug: str,
+        fn: Callable[[], Any],
+        on_refresh: Callable[[], Any] | None = None,
+    ) -> Any:
+        """
+        Call 'fn', which relies on the metadata of the project. Should Transifex tell that metadata is outdated,
+        with a resource (or project) deleted (404) or created (409) since it was looked up, the metadata is
+        forgotten, then 'on_refresh' (if any) and 'fn' are called once more.
+        """
+        try:
+            return fn()
+        except JsonApiException as error:
+            if not error.status_code in STALE_STATUS_CODES:
+                raise
             logger.info(
-                f"Attempting to get 'o:{self.organization_name}:p:{project_slug}'"
+                f"Looking up the metadata of {project_slug} again, as it is outdated: {error}"
             )
+            self.invalidate(project_slug)
+            if on_refresh:
+                on_refresh()
+            return fn()
+
+    @ensure_login
+    def get_resource_index(self, project_slug: str) -> dict[str, Resource]:
+        """Resources of the project keyed by slug, fetched once and memoized"""
+
+        def fetch_resources() -> dict[str, Resource]:
+            if project := self.get_project(project_slug=project_slug):
+                resources = project.fetch("resources").all()
+                return {resource.slug: resource for resource in resources}
+
+            raise ValueError(
+                f"Couldn't find any project with this slug: '{project_slug}'"
+            )
+
+        return self.resource_index.get_or_set(
+            project_slug,
+            lambda: self.remember(
+                self.metadata_key("resources", project_slug),
+                fetch_resources,
+                dump=lambda index: {slug: r.to_dict() for slug, r in index.items()},
+                load=lambda data: {
+                    slug: tx_api.Resource(d) for slug, d in data.items()
+                },
+            ),
+        )
+
+    @ensure_login
+    def get_language(self, language_code: str) -> Resource:
+        """
+        Language matching the given code, once normalized (see 'normalize_language_code'): resolved from the catalog
+        of the languages of Transifex, loaded once per process, or else fetched and memoized.
+        Its 'code' is spelled as Transifex does, such as in statistics. Raises a ValueError for invalid or unknown codes.
+        """
+        code = normalize_language_code(language_code)
+
+        def resolve() -> Resource:
+            if data := registry.resolve(
+                code,
+                self.fetch_languages_catalog,
+                self.path_to_language_cache,
+                self.language_ttl,
+            ):
+                return tx_api.Language(data)
+
+            # Added to Transifex since the catalog was loaded, if at all, spelled either way
+            for spelling in dict.fromkeys([code, language_code.strip()]):
+                try:
+                    with self.instrumentation.phase(
+                        "metadata", key=f"language/{spelling}"
+                    ):
+                        language = tx_api.Language.get(code=spelling)
+                except DoesNotExist:
+                    continue
+                registry.add(language.to_dict())
+                return language
+            raise ValueError(f"Unknown language code: '{language_code}'")
+
+        return self.language_index.get_or_set(code, resolve)
+
+    def resolve_language_codes(self, language_codes: list[str]) -> list[str]:
+        """The codes as Transifex spells them (see 'get_language'), without duplicates"""
+        return list(dict.fromkeys(self.get_language(c).code for c in language_codes))
+
+    def fetch_languages_catalog(self) -> list[dict[str, Any]]:
+        """All the languages of Transifex, in a single paginated listing"""
+        with self.instrumentation.phase("metadata", key="languages"):
+            return [language.to_dict() for language in tx_api.Language.all()]
+
+    @ensure_login
+    def get_project(self, project_slug: str) -> None | Resource:
+        """Fetches the project matching the given slug, memoized once found"""
+
+        def fetch_project() -> None | Resource:
+            project_id = f"o:{self.organization_name}:p:{project_slug}"
+            logger.info(f"Attempting to get '{project_id}'")
             try:
-                res = self.projects.get(slug=project_slug)
+                res = tx_api.Project.get(id=project_id)
                 logger.info("Got the project!")
                 return res
-            except DoesNotExist:
-                return None
-            """
-            except MultipleObjectsReturned:
-                pass
-            """
+            except JsonApiException as error:
+                if error.status_code == 404:
+                    return None
+                raise
+
+        project = self.project_index.get_or_set(
+            project_slug,
+            lambda: self.remember(
+                self.metadata_key("project", project_slug),
+                fetch_project,
+                dump=Resource.to_dict,
+                load=tx_api.Project,
+            ),
+        )
+        if not project:
+            # Not memoizing absent projects, as they may be created later on
+            self.project_index.pop(project_slug)
+        return project
 
     @ensure_login
     def list_resources(self, project_slug: str) -> list[Any]:
         """List all resources for the project passed as argument"""
-        if project := self.get_project(project_slug=project_slug):
-            if resources := project.fetch("resources"):
-                return list(resources.all())
-            else:
-                return []
-
-        raise ValueError(
-            f"Unable to find any project under this organization: '{self.organization}'"
-        )
+        return list(self.get_resource_index(project_slug).values())
 
     @ensure_login
     def create_resource(
@@ -126,6 +389,28 @@ class Client(Tx):
         if not (resource_slug or resource_name):
             raise ValueError("Please give either a resource_slug or a resource_name")
 
+        resource = self._create_empty_resource(
+            project_slug=project_slug,
+            resource_slug=resource_slug,
+            resource_name=resource_name,
+            **kwargs,
+        )
+
+        job = self.submit_upload(resource, path_to_file)
+        result = self.wait_for(job, upload_outcome)
+        logger.info(f"Resource created: {resource_slug or resource_name}")
+        return result
+
+    @ensure_login
+    def _create_empty_resource(
+        self,
+        *,
+        project_slug: str,
+        resource_slug: str | None = None,
+        resource_name: str | None = None,
+        **kwargs,
+    ) -> Resource:
+        """Create a resource without any content yet"""
         if project := self.get_project(project_slug=project_slug):
             resource = tx_api.Resource.create(
                 project=project,
@@ -134,27 +419,29 @@ class Client(Tx):
                 i18n_format=tx_api.I18nFormat(id=self.i18n_type),
                 **kwargs,
             )
+            self.invalidate(project_slug)
+            return resource
 
-            with open(path_to_file, "r") as fh:
-                content = fh.read()
-
-            tx_api.ResourceStringsAsyncUpload.upload(content, resource=resource)
-            logger.info(f"Resource created: {resource_slug or resource_name}")
-
-        else:
-            raise ValueError(
-                f"Not project could be found with the slug '{project_slug}'. Please create a project first."
-            )
+        raise ValueError(
+            f"Not project could be found with the slug '{project_slug}'. Please create a project first."
+        )
 
     @ensure_login
     def update_source_translation(
-        self, project_slug: str, resource_slug: str, path_to_file: str
+        self,
+        project_slug: str,
+        resource_slug: str,
+        path_to_file: str,
+        delta: bool = False,
     ):
         """
         Update the translation strings for the given resource using the content of the file
-        passsed as argument
+        passsed as argument. With 'delta', only the strings that changed are sent (see 'update_source_strings').
         """
-        if not "slug" in self.organization.attributes:
+        if delta:
+            return self.update_source_strings(project_slug, resource_slug, path_to_file)
+
+        if not self.organization_name:
             raise ValueError(
                 "Unable to fetch resource for this organization; define an 'organization slug' first."
             )
@@ -163,19 +450,10 @@ class Client(Tx):
             f"Updating source translation for resource {resource_slug} from file {path_to_file} (project: {project_slug})."
         )
 
-        if project := self.get_project(project_slug=project_slug):
-            if resources := project.fetch("resources"):
-                if resource := resources.get(slug=resource_slug):
-                    with open(path_to_file, "r") as fh:
-                        content = fh.read()
-
-                    tx_api.ResourceStringsAsyncUpload.upload(content, resource=resource)
-                    logger.info(f"Source updated for resource: {resource_slug}")
-                    return
-
-        raise ValueError(
-            f"Unable to find resource '{resource_slug}' in project '{project_slug}'"
-        )
+        job = self.submit_source_upload(project_slug, resource_slug, path_to_file)
+        result = self.wait_for(job, upload_outcome)
+        logger.info(f"Source updated for resource: {resource_slug}")
+        return result
 
     @ensure_login
     def get_translation(
@@ -187,64 +465,252 @@ class Client(Tx):
         path_to_output_dir: None | str = None,
     ) -> str:
         """Fetch the translation resource matching the given language"""
-        if path_to_output_dir and not path_to_output_file:
-            path_to_parent = Path(path_to_output_dir)
-            path_to_output_file = str(
-                path_to_parent.joinpath(f"{resource_slug}_{language_code}")
+        language = self.get_language(language_code)
+        path_to_output_file = self.prepare_output_file(
+            resource_slug, language.code, path_to_output_file, path_to_output_dir
+        )
+        job = self.submit_translation_download(project_slug, resource_slug, language)
+        url = self.wait_for(job, download_outcome)
+        if self.download(url, path_to_output_file):
+            logger.info(
+                f"Translations downloaded and written to file (resource: {resource_slug})"
             )
-        elif path_to_output_file and not path_to_output_dir:
-            path_to_parent = Path(path_to_output_file).parent
         else:
+            logger.info(
+                f"Translations downloaded, file left untouched as it is up to date (resource: {resource_slug})"
+            )
+        return str(path_to_output_file)
+
+    @ensure_login
+    def get_source_strings(
+        self, project_slug: str, resource_slug: str
+    ) -> dict[tuple[str, str], Resource]:
+        """Source strings of the resource keyed by (key, context), fetched once and memoized"""
+
+        def fetch_strings() -> dict[tuple[str, str], Resource]:
+            if resource := self.get_resource_index(project_slug).get(resource_slug):
+                with self.instrumentation.phase("metadata", key=resource.id):
+                    strings = tx_api.ResourceString.filter(resource=resource).all()
+                    return {
+                        (s.key, s.attributes.get("context") or ""): s for s in strings
+                    }
+
             raise ValueError(
-                f"get_translation needs exactly one between 'path_to_output_file' (str) or 'path_to_output_dir (str)'. "
+                f"Unable to find resource '{resource_slug}' in project '{project_slug}'"
             )
 
-        Path.mkdir(path_to_parent, parents=True, exist_ok=True)
-        language = tx_api.Language.get(code=language_code)
+        return self.source_strings.get_or_set(
+            (project_slug, resource_slug), fetch_strings
+        )
 
-        if project := self.get_project(project_slug=project_slug):
-            if resources := project.fetch("resources"):
-                if resource := resources.get(slug=resource_slug):
-                    url = tx_api.ResourceTranslationsAsyncDownload.download(
-                        resource=resource, language=language
-                    )
-                    translated_content = requests.get(url).text
-                    with open(path_to_output_file, "w") as fh:
-                        fh.write(translated_content)
+    @ensure_login
+    def update_source_strings(
+        self, project_slug: str, resource_slug: str, path_to_file: str
+    ) -> dict[str, int]:
+        """
+        Update the source strings of the resource from a PO file, sending only the strings added,
+        changed (plural form, comments or occurrences) or removed since through the bulk endpoints,
+        instead of having the whole file parsed again by Transifex.
+        Returns the counts of strings created, updated and deleted, as the details of an upload job do.
+        """
+        if self.i18n_type != "PO":
+            raise ValueError(
+                f"Only PO sources can be updated string by string, not {self.i18n_type}."
+            )
 
-                    logger.info(
-                        f"Translations downloaded and written to file (resource: {resource_slug})"
-                    )
-                    return str(path_to_output_file)
+        remote = self.get_source_strings(project_slug, resource_slug)
+        resource = self.get_resource_index(project_slug)[resource_slug]
+        local = {
+            (entry.msgid, entry.msgctxt or ""): {
+                "strings": entry.source_strings(),
+                "pluralized": entry.msgid_plural is not None,
+                "developer_comment": "\n".join(entry.comments),
+                "occurrences": ", ".join(entry.occurrences),
+            }
+            for entry in read_po(path_to_file)
+            if not entry.is_header
+        }
+
+        created = [(k, v) for k, v in local.items() if not k in remote]
+        updated = [
+            (remote[k].id, v)
+            for k, v in local.items()
+            if k in remote
+            and any(
+                # Empty comments and occurrences may come back as None
+                (remote[k].attributes.get(f) or None) != (v[f] or None)
+                for f in SOURCE_STRING_FIELDS
+            )
+        ]
+        deleted = [s for k, s in remote.items() if not k in local]
+
+        try:
+            for chunk in chunks(created, BULK_SIZE):
+                tx_api.ResourceString.bulk_create(
+                    [
+                        ({"key": key, "context": context, **v}, {"resource": resource})
+                        for (key, context), v in chunk
+                    ]
+                )
+            for chunk in chunks(updated, BULK_SIZE):
+                tx_api.ResourceString.bulk_update(chunk, SOURCE_STRING_FIELDS)
+            for chunk in chunks(deleted, BULK_SIZE):
+                tx_api.ResourceString.bulk_delete(chunk)
+        finally:
+            # Outdated as soon as anything was sent
+            self.source_strings.pop((project_slug, resource_slug))
+
+        logger.info(
+            f"Source strings of {resource_slug} updated: {len(created)} created, {len(updated)} updated, {len(deleted)} deleted."
+        )
+        return {
+            "strings_created": len(created),
+            "strings_updated": len(updated),
+            "strings_deleted": len(deleted),
+        }
+
+    def download(self, url: str, path_to_output_file: str) -> bool:
+        """
+        Stream the file at the URL to the given path through the client's session, with constant memory use.
+        Tells whether the file was written, see 'stream_to_file'.
+        """
+        self.instrumentation.count("requests")
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        with self.slots, self.instrumentation.phase(
+            "download", path=path_to_output_file
+        ):
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                written = stream_to_file(response, path_to_output_file)
+
+        self.instrumentation.count(
+            "bytes_downloaded", Path(path_to_output_file).stat().st_size
+        )
+        return written
+
+    def submit_download(self, resource: Resource, language: Resource) -> Resource:
+        with self.instrumentation.phase(
+            "submit", resource=resource.id, language=language.id
+        ):
+            return submit_download(resource, language)
+
+    def submit_upload(self, resource: Resource, path_to_file: str) -> Resource:
+        with open(path_to_file, "r") as fh:
+            content = fh.read()
+
+        self.instrumentation.count("bytes_uploaded", len(content.encode()))
+        with self.instrumentation.phase("submit", resource=resource.id):
+            return submit_upload(resource, content)
+
+    def submit_source_upload(
+        self, project_slug: str, resource_slug: str, path_to_file: str
+    ) -> Resource:
+        """Submit the upload job of the file to the resource, looked up again if outdated (see 'refreshing')"""
+
+        def submit() -> Resource:
+            if resource := self.get_resource_index(project_slug).get(resource_slug):
+                return self.submit_upload(resource, path_to_file)
+            raise ValueError(
+                f"Unable to find resource '{resource_slug}' in project '{project_slug}'"
+            )
+
+        return self.refreshing(project_slug, submit)
+
+    def submit_translation_download(
+        self, project_slug: str, resource_slug: str, language: Resource
+    ) -> Resource:
+        """Submit the download job of the translation of the resource, looked up again if outdated (see 'refreshing')"""
+
+        def submit() -> Resource:
+            if resources := self.get_resource_index(project_slug):
+                if resource := resources.get(resource_slug):
+                    return self.submit_download(resource, language)
 
-                else:
-                    raise ValueError(
-                        f"Unable to find any resource with this slug: '{resource_slug}'"
-                    )
-            else:
                 raise ValueError(
-                    f"Unable to find any resource for this project: '{project_slug}'"
+                    f"Unable to find any resource with this slug: '{resource_slug}'"
                 )
+            raise ValueError(
+                f"Unable to find any resource for this project: '{project_slug}'"
+            )
+
+        return self.refreshing(project_slug, submit)
+
+    def coordinator(
+        self, pool: ThreadPoolExecutor, outcome: Callable[[Resource], tuple[bool, Any]]
+    ) -> JobCoordinator:
+        """Coordinator of jobs polling on the given pool with the client's settings"""
+        return JobCoordinator(
+            pool,
+            outcome,
+            poll_interval=self.poll_interval,
+            max_poll_interval=self.max_poll_interval,
+            retries=self.retries,
+            instrumentation=self.instrumentation,
+        )
+
+    def wait_for(
+        self, job: Resource, outcome: Callable[[Resource], tuple[bool, Any]]
+    ) -> Any:
+        """Poll a single job until it's done, returning its result or raising its error"""
+        with ThreadPoolExecutor(1) as pool:
+            ((_, result),) = self.coordinator(pool, outcome).run({0: job})
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    @staticmethod
+    def prepare_output_file(
+        resource_slug: str,
+        language_code: str,
+        path_to_output_file: None | str = None,
+        path_to_output_dir: None | str = None,
+    ) -> str:
+        """Path of the file a translation is written to, creating its parent directory if needed"""
+        if path_to_output_dir and not path_to_output_file:
+            path_to_parent = Path(path_to_output_dir)
+            path_to_output_file = str(
+                path_to_parent.joinpath(f"{resource_slug}_{language_code}")
+            )
+        elif path_to_output_file and not path_to_output_dir:
+            path_to_parent = Path(path_to_output_file).parent
         else:
             raise ValueError(
-                f"Couldn't find any project with this slug: '{project_slug}'"
+                f"get_translation needs exactly one between 'path_to_output_file' (str) or 'path_to_output_dir (str)'. "
             )
 
+        Path.mkdir(path_to_parent, parents=True, exist_ok=True)
+        return path_to_output_file
+
     @ensure_login
-    def list_languages(self, project_slug: str) -> list[str]:
+    def list_languages(self, project_slug: str, fresh: bool = False) -> list[str]:
         """
         List languages for which there exist translations under the given resource.
+        With 'fresh', they are fetched again rather than taken from the memo or the metadata cache.
         """
-        if self.projects:
-            if project := self.projects.get(slug=project_slug):
+        if fresh:
+            self.project_languages.pop(project_slug)
+            if self.metadata:
+                self.metadata.pop(self.metadata_key("languages", project_slug))
+
+        def fetch_languages() -> list[str]:
+            if project := self.get_project(project_slug=project_slug):
                 languages = project.fetch("languages").all()
                 return [lang.code for lang in languages]
 
             raise ValueError(
                 f"Unable to find any project with this slug: '{project_slug}'"
             )
-        raise ValueError(
-            f"Unable to find any project under this organization: '{self.organization}'"
+
+        # Copied so that callers may edit the list without affecting the memo
+        return list(
+            self.project_languages.get_or_set(
+                project_slug,
+                lambda: self.remember(
+                    self.metadata_key("languages", project_slug), fetch_languages
+                ),
+            )
         )
 
     @ensure_login
@@ -256,18 +722,76 @@ class Client(Tx):
         coordinators: None | list[str] = None,
     ):
         """Create a new language resource in the remote Transifex repository"""
-        if project := self.get_project(project_slug=project_slug):
-            if language := tx_api.Language.get(code=language_code):
-                logger.debug(f"Adding {language.code} to {project_slug}")
-                project.add("languages", [language])
+        self.create_languages(
+            project_slug=project_slug,
+            language_codes=[language_code],
+            coordinators=coordinators,
+        )
+
+    @ensure_login
+    def create_languages(
+        self,
+        *,
+        project_slug: str,
+        language_codes: list[str],
+        coordinators: None | list[str] = None,
+    ) -> list[str]:
+        """
+        Add the languages the project doesn't have yet, in a single request, then the coordinators
+        (usernames) it doesn't have yet (see 'list_coordinators') in another one. Languages are resolved locally (see 'get_language') and compared with
+        those of the project (see 'list_languages'), so that the requests don't grow with the languages.
+        Returns the codes of the languages added.
+        """
+        if not (project := self.get_project(project_slug=project_slug)):
+            raise ValueError(
+                f"Unable to find any project with this slug: '{project_slug}'"
+            )
 
-            if coordinators:
-                project.add("coordinators", coordinators)
+        existing = set(self.list_languages(project_slug))
+        languages = {}
+        for language_code in language_codes:
+            language = self.get_language(language_code)
+            if not language.code in existing:
+                languages[language.id] = language
 
-            logger.info(
-                f"Created language resource for {language_code} and added these coordinators: {coordinators}"
+        if languages:
+            logger.debug(f"Adding {list(languages)} to {project_slug}")
+            project.add("languages", list(languages.values()))
+            self.invalidate(project_slug)
+
+        missing = []
+        if coordinators:
+            existing = set(self.list_coordinators(project_slug))
+            missing = [u for u in dict.fromkeys(coordinators) if not u in existing]
+        if missing:
+            project.add(
+                "coordinators",
+                [tx_api.User(id=f"u:{username}") for username in missing],
             )
 
+        added = [language.code for language in languages.values()]
+        logger.info(
+            f"Added languages {added} to {project_slug}, and these coordinators: {missing}"
+        )
+        return added
+
+    @ensure_login
+    def list_coordinators(self, project_slug: str) -> list[str]:
+        """Usernames of the coordinators of the project, fetched from its (paginated) relationship"""
+        if not (project := self.get_project(project_slug=project_slug)):
+            raise ValueError(
+                f"Unable to find any project with this slug: '{project_slug}'"
+            )
+
+        usernames = []
+        url = f"/projects/{project.id}/relationships/coordinators"
+        with self.instrumentation.phase("metadata", key=f"coordinators/{project_slug}"):
+            while url:
+                page = tx_api.request("get", url)
+                usernames += [user["id"].removeprefix("u:") for user in page["data"]]
+                url = page.get("links", {}).get("next")
+        return usernames
+
     @ensure_login
     def project_exists(self, project_slug: str) -> bool:
         """Check if the project exists in the remote Transifex repository"""
@@ -289,75 +813,849 @@ class Client(Tx):
 
     @ensure_login
     def get_project_stats(self, project_slug: str) -> dict[str, Any]:
-        if self.projects:
-            if project := self.projects.get(slug=project_slug):
-                if resource_stats := tx_api.ResourceLanguageStats(project=project):
-                    return resource_stats.to_dict()
+        if project := self.get_project(project_slug=project_slug):
+            if resource_stats := tx_api.ResourceLanguageStats(project=project):
+                return resource_stats.to_dict()
 
         raise ValueError(f"Unable to find translation for this project {project_slug}")
 
+    @ensure_login
+    def get_language_stats(
+        self, project_slug: str, language_codes: list[str] | None = None
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """
+        Fetch the statistics of every (resource, language) pair of the project in one listing,
+        keyed by (resource_slug, language_code).
+        With 'language_codes', only the pairs of these languages are fetched, through one listing per language
+        run concurrently.
+        """
+        if language_codes is not None:
+            language_codes = self.resolve_language_codes(language_codes)
+
+        if project := self.get_project(project_slug=project_slug):
+
+            def fetch_stats(language_code: str | None = None) -> list[Resource]:
+                filters = {"project": project}
+                if language_code:
+                    filters["language"] = f"l:{language_code}"
+                with self.instrumentation.phase(
+                    "metadata", key=f"stats/{project_slug}/{language_code or '*'}"
+                ):
+                    return list(tx_api.ResourceLanguageStats.filter(**filters).all())
+
+            if language_codes is None:
+                listings = [fetch_stats()]
+            else:
+                listings = self.run_concurrently(
+                    [partial(fetch_stats, code) for code in language_codes]
+                )
+                if errors := [e for e in listings if isinstance(e, Exception)]:
+                    raise errors[0]
+
+            stats = {}
+            for stat in (stat for listing in listings for stat in listing):
+                # Ids look like 'o:<organization>:p:<project>:r:<resource>:l:<language>'
+                path_to_resource, language_code = stat.id.rsplit(":l:", 1)
+                resource_slug = path_to_resource.rsplit(":r:", 1)[-1]
+                stats[(resource_slug, language_code)] = stat.attributes
+            return stats
+
+        raise ValueError(f"Couldn't find any project with this slug: '{project_slug}'")
+
     @ensure_login
     def pull(
         self,
         *,
         project_slug: str,
-        resource_slugs: list[str],
-        language_codes: list[str],
+        resource_slugs: list[str] | None = None,
+        language_codes: list[str] | None = None,
+        path_to_output_dir: str,
+        path_to_state: str | None = None,
+        force: bool = False,
+        by_language: bool = False,
+        path_to_journal: str | None = None,
+        resume: bool = False,
+        offline: bool = False,
+        compile_catalogs: bool = False,
+    ) -> Stats:
+        """
+        Pull the translations of the project into the output directory, and return the timings and counters of the pull.
+        Options are those of 'pytx pull', 'path_to_state' and 'path_to_journal' being where its 'PullState' and 'Journal' go.
+        """
+        if compile_catalogs and self.i18n_type != "PO":
+            raise ValueError(
+                f"Only PO catalogs can be compiled, not {self.i18n_type} files"
+            )
+
+        before = self.instrumentation.snapshot()
+        if offline:
+            self.restore_offline(
+                project_slug,
+                resource_slugs,
+                language_codes,
+                path_to_output_dir,
+                compile_catalogs=compile_catalogs,
+            )
+            return self.instrumentation.snapshot().since(before)
+
+        args, state, stats = self._plan_pull(
+            project_slug=project_slug,
+            resource_slugs=resource_slugs,
+            language_codes=language_codes,
+            path_to_output_dir=path_to_output_dir,
+            path_to_state=path_to_state,
+            force=force,
+            by_language=by_language,
+        )
+        restored, args, written = (
+            ([], args, [])
+            if force
+            else self.restore_from_store(project_slug, args, stats)
+        )
+        journal = Journal(path_to_journal, resume) if path_to_journal else None
+        res = None
+        try:
+            res = self.download_translations(
+                args, journal, compile_catalogs=compile_catalogs
+            )
+        finally:
+            if journal:
+                journal.close(res is not None and not has_failures(res))
+
+        paths = [
+            self.prepare_output_file(slug, l_code, None, out)
+            for _, slug, l_code, out in restored
+        ]
+        restored_res = (
+            self.compile_files(paths, written) if compile_catalogs else list(paths)
+        )
+        self._conclude_pull(
+            project_slug, restored + args, restored_res + res, state, stats
+        )
+        return self.instrumentation.snapshot().since(before)
+
+    def download_translations(
+        self,
+        args: list[tuple],
+        journal: Journal | None = None,
+        compile_catalogs: bool = False,
+    ) -> list[Any]:
+        """
+        Download the translations for the (project_slug, resource_slug, language_code, path_to_output_dir) arguments,
+        all jobs submitted before being followed at once; return the paths written or the exceptions raised, in order.
+        """
+        paths = [
+            self.prepare_output_file(slug, l_code, None, out)
+            for _, slug, l_code, out in args
+        ]
+        keys = [f"{arg[0]}:{path}" for arg, path in zip(args, paths)]
+
+        def submit(
+            i: int,
+            project_slug: str,
+            resource_slug: str,
+            language_code: str,
+            path_to_output_dir: str,
+        ) -> Resource:
+            if journal and (job_id := journal.jobs.get(keys[i])):
+                return tx_api.ResourceTranslationsAsyncDownload(id=job_id)
+
+            job = self.submit_translation_download(
+                project_slug, resource_slug, self.get_language(language_code)
+            )
+            if journal:
+                journal.submitted(keys[i], job.id)
+            return job
+
+        res: list[Any] = list(paths)
+        todo = [
+            i
+            for i, key in enumerate(keys)
+            if not (journal and key in journal.completed and Path(paths[i]).exists())
+        ]
+        if journal and len(todo) < len(args):
+            logger.info(
+                f"Resuming: {len(args) - len(todo)} translation(s) already downloaded."
+            )
+        resumed = [i for i in todo if journal and keys[i] in journal.jobs]
+
+        submitted = self.run_concurrently([partial(submit, i, *args[i]) for i in todo])
+        for i, job in zip(todo, submitted):
+            res[i] = job
+        jobs = {i: job for i, job in zip(todo, submitted) if isinstance(job, Resource)}
+        logger.info(f"Submitted {len(jobs)} download job(s) out of {len(todo)}.")
+
+        # Downloads, handing files over to the compiler, are waited for before the compiler when interrupted
+        with (
+            compiler_pool() if compile_catalogs else nullcontext()
+        ) as compiler, ThreadPoolExecutor(
+            self.max_workers
+        ) as polls, ThreadPoolExecutor(
+            self.max_workers
+        ) as downloads:
+            download = with_retries(
+                self.download,
+                retries=self.retries,
+                on_retry=partial(self.instrumentation.count, "retries"),
+            )
+
+            def fetch(i: int, url: str) -> Future | None:
+                """
+                Download the file of the i-th job, then hand it over to the compiler (returning the compilation)
+                or else record it as done: right away, rather than once all the jobs are followed.
+                """
+                try:
+                    written = download(url, paths[i])
+                except Exception:
+                    if journal:
+                        journal.failed(keys[i])
+                    raise
+
+                if compiler and needs_compiling(paths[i], written):
+                    compilation = compiler.submit(compile_mo, paths[i])
+                    compilation.add_done_callback(partial(compiled_one, i))
+                    return compilation
+                if journal:
+                    journal.done(keys[i])
+                return None
+
+            def compiled_one(i: int, compilation: Future):
+                if journal and not compilation.cancelled():
+                    if compilation.exception():
+                        journal.failed(keys[i])
+                    else:
+                        journal.done(keys[i])
+
+            def follow(jobs: dict[int, Resource]):
+                for i, url in self.coordinator(polls, download_outcome).run(jobs):
+                    if isinstance(url, Exception):
+                        res[i] = url
+                        if journal:
+                            journal.failed(keys[i])
+                    else:
+                        fetched[downloads.submit(fetch, i, url)] = i
+
+            fetched: dict[Future, int] = {}
+            follow(jobs)
+            # Jobs of the journal failing to be followed again, such as expired ones, are submitted anew
+            if expired := [i for i in resumed if isinstance(res[i], Exception)]:
+                logger.info(
+                    f"Submitting again {len(expired)} job(s) that couldn't be followed again."
+                )
+                submitted = self.run_concurrently(
+                    [partial(submit, i, *args[i]) for i in expired]
+                )
+                for i, job in zip(expired, submitted):
+                    res[i] = job
+                follow(
+                    {
+                        i: job
+                        for i, job in zip(expired, submitted)
+                        if isinstance(job, Resource)
+                    }
+                )
+
+            compiled = {}
+            for future in as_completed(fetched):
+                i = fetched[future]
+                if error := future.exception():
+                    res[i] = error
+                elif compilation := future.result():
+                    compiled[compilation] = i
+                else:
+                    res[i] = paths[i]
+
+            for future in as_completed(compiled):
+                i = compiled[future]
+                if error := future.exception():
+                    res[i] = error
+                else:
+                    res[i] = paths[i]
+                    self.instrumentation.count("files_compiled")
+
+        return res
+
+    def compile_files(self, paths: list[str], written: list[bool]) -> list[Any]:
+        """
+        Compile the PO files that need it (see 'needs_compiling') in a process pool,
+        and return for each file its path or the exception raised.
+        """
+        res: list[Any] = list(paths)
+        to_compile = [i for i, p in enumerate(paths) if needs_compiling(p, written[i])]
+        if not to_compile:
+            return res
+
+        with compiler_pool() as compiler:
+            futures = {compiler.submit(compile_mo, paths[i]): i for i in to_compile}
+            for future in as_completed(futures):
+                if error := future.exception():
+                    res[futures[future]] = error
+                else:
+                    self.instrumentation.count("files_compiled")
+        return res
+
+    def restore_from_store(
+        self,
+        project_slug: str,
+        args: list[tuple],
+        stats: dict[tuple[str, str], dict[str, Any]],
+    ) -> tuple[list[tuple], list[tuple], list[bool]]:
+        """
+        Write the translations whose revision is in store to their output files;
+        return the arguments of those restored, then of those left to download,
+        and whether each file restored was written (see 'TranslationStore.restore').
+        """
+        if not self.store:
+            return [], args, []
+
+        restored, remaining, written = [], [], []
+        for arg in args:
+            _, slug, l_code, out = arg
+            revision = stats.get((slug, l_code), {}).get("last_update")
+            if revision and (
+                path := self.store.get(project_slug, slug, l_code, revision)
+            ):
+                path_to_output_file = self.prepare_output_file(slug, l_code, None, out)
+                written.append(self.store.restore(path, path_to_output_file))
+                restored.append(arg)
+            else:
+                remaining.append(arg)
+
+        if restored:
+            self.instrumentation.count("files_restored", len(restored))
+            logger.info(
+                f"Restored {len(restored)} unchanged translation(s) of {project_slug} from the store."
+            )
+        return restored, remaining, written
+
+    def restore_offline(
+        self,
+        project_slug: str,
+        resource_slugs: list[str] | None,
+        language_codes: list[str] | None,
         path_to_output_dir: str,
+        compile_catalogs: bool = False,
     ):
-        """Pull resources from project."""
+        """
+        Write the translations of the project to the output directory from the store alone, without any request:
+        all those in store when 'resource_slugs' (resp. 'language_codes') is None, otherwise the requested ones.
+        With 'compile_catalogs', those written are compiled to MO files as in 'pull'.
+        """
+        if not self.store:
+            raise ValueError(
+                "Pulling offline needs a translation store, see 'Client.use_store'"
+            )
+        pairs = self.store.translations(project_slug)
+        if language_codes is not None:
+            # Spelled as in the store, that is as Transifex does
+            spellings = {language_key(l_code): l_code for _, l_code in pairs}
+            language_codes = list(
+                dict.fromkeys(
+                    spellings.get(key, key)
+                    for key in map(normalize_language_code, language_codes)
+                )
+            )
+        if resource_slugs is None or language_codes is None:
+            targets = [
+                (slug, l_code)
+                for slug, l_code in pairs
+                if (resource_slugs is None or slug in resource_slugs)
+                and (language_codes is None or l_code in language_codes)
+            ]
+        else:
+            targets = [(s, l) for l in language_codes for s in resource_slugs]
+
+        args, res, written = [], [], {}
+        for slug, l_code in targets:
+            args.append((project_slug, slug, l_code, path_to_output_dir))
+            if path := self.store.get(project_slug, slug, l_code):
+                path_to_output_file = self.prepare_output_file(
+                    slug, l_code, None, path_to_output_dir
+                )
+                written[len(res)] = self.store.restore(path, path_to_output_file)
+                res.append(path_to_output_file)
+            else:
+                res.append(ValueError(f"No translation of {slug} in {l_code} in store"))
+
+        self.instrumentation.count("files_restored", len(written))
+        logger.info(
+            f"Restored {len(written)} translation(s) of {project_slug} from the store."
+        )
+        if compile_catalogs:
+            compiled = self.compile_files(
+                [res[i] for i in written], list(written.values())
+            )
+            for i, r in zip(written, compiled):
+                res[i] = r
+        self._conclude_pull(project_slug, args, res, None, {})
+
+    def _plan_pull(
+        self,
+        *,
+        project_slug: str,
+        resource_slugs: list[str] | None,
+        language_codes: list[str] | None,
+        path_to_output_dir: str,
+        path_to_state: str | None,
+        force: bool,
+        by_language: bool = False,
+    ) -> tuple[list[tuple], PullState | None, dict[tuple[str, str], dict[str, Any]]]:
+        """Arguments of the 'get_translation' calls needed by a pull, along with the pull state if any"""
+        discover = resource_slugs is None or language_codes is None
+        # Discovered from Transifex itself, not from metadata cached before languages were added
+        if language_codes is None:
+            language_codes = self.list_languages(project_slug, fresh=True)
+        else:
+            # Spelled as in the statistics, the pull state and the store
+            language_codes = self.resolve_language_codes(language_codes)
+
+        state = PullState(path_to_state) if path_to_state else None
+        if by_language:
+            stats = self.get_language_stats(project_slug, language_codes)
+        elif state or discover or self.store:
+            stats = self.get_language_stats(project_slug)
+        else:
+            stats = {}
+
+        if resource_slugs is None:
+            # Those of the statistics just fetched, rather than of a resource index cached before changes
+            resource_slugs = list(dict.fromkeys(slug for slug, _ in stats))
+
         args = []
         for l_code in language_codes:
             for slug in resource_slugs:
                 args.append(tuple([project_slug, slug, l_code, path_to_output_dir]))
 
-        res = concurrently(
-            fn=self.get_translation,
-            args=args,
+        if discover or by_language:
+            empty = {
+                (slug, l_code)
+                for _, slug, l_code, _ in args
+                if stats.get((slug, l_code), {}).get("translated_strings") == 0
+            }
+            if empty:
+                logger.info(
+                    f"Skipping {len(empty)} translation(s) without any translated string for {project_slug}."
+                )
+            args = [arg for arg in args if not (arg[1], arg[2]) in empty]
+
+        if state and not force:
+            unchanged = {
+                (slug, l_code)
+                for _, slug, l_code, _ in args
+                if (slug, l_code) in stats
+                and state.is_unchanged(
+                    project_slug, slug, l_code, stats[(slug, l_code)]
+                )
+                and Path.exists(Path(path_to_output_dir).joinpath(f"{slug}_{l_code}"))
+            }
+            if unchanged:
+                logger.info(
+                    f"Skipping {len(unchanged)} unchanged translation(s) for {project_slug}: {sorted(unchanged)}"
+                )
+            args = [arg for arg in args if not (arg[1], arg[2]) in unchanged]
+
+        return args, state, stats
+
+    def _conclude_pull(
+        self,
+        project_slug: str,
+        args: list[tuple],
+        res: list[Any],
+        state: PullState | None,
+        stats: dict[tuple[str, str], dict[str, Any]],
+    ):
+        """
+        Save the pull state of the pairs pulled successfully and store their files (pruning the store of the files
+        they replace), then report those which failed
+        """
+        failed = [(arg, r) for arg, r in zip(args, res) if isinstance(r, Exception)]
+
+        logger.info(
+            f"Pulled {args} for {len(res) - len(failed)} results ({len(failed)} failed)."
         )
 
-        logger.info(f"Pulled {args} for {len(res)} results).")
+        if state:
+            for (_, slug, l_code, _), r in zip(args, res):
+                if not isinstance(r, Exception) and (slug, l_code) in stats:
+                    state.record(project_slug, slug, l_code, stats[(slug, l_code)])
+            state.to_disk()
+
+        if self.store:
+            for (_, slug, l_code, _), r in zip(args, res):
+                revision = stats.get((slug, l_code), {}).get("last_update")
+                if not isinstance(r, Exception) and revision:
+                    self.store.put(project_slug, slug, l_code, revision, r)
+            self.store.to_disk()
+            self.store.prune()
+
+        if failed:
+            raise_for_failures("pull", [(f"{a[1]}/{a[2]}", e) for a, e in failed])
 
-    @ensure_login
     def push(
-        self, *, project_slug: str, resource_slugs: list[str], path_to_files: list[str]
-    ):
-        """Push resources with files under project."""
+        self,
+        *,
+        project_slug: str,
+        resource_slugs: list[str],
+        path_to_files: list[str],
+        path_to_manifest: str | None = None,
+        force: bool = False,
+        delta: bool = False,
+        path_to_journal: str | None = None,
+        resume: bool = False,
+    ) -> PushResult:
+        """
+        Push resources with files under project, and report what happened to each of them.
+        When 'path_to_manifest' is given, files whose content did not change since the last push
+        recorded in the manifest are skipped before any network call, unless 'force' is set.
+        With 'delta', existing resources only get the strings that changed (see 'update_source_strings').
+        When 'path_to_journal' is given, the progress of the push is logged there (see 'Journal'); with 'resume',
+        the push takes over from the one interrupted while logging to it.
+        The result includes the timings and counters of the push.
+        """
+        before = self.instrumentation.snapshot()
+        resource_zipped_with_path, manifest, digests = self._plan_push(
+            project_slug=project_slug,
+            resource_slugs=resource_slugs,
+            path_to_files=path_to_files,
+            path_to_manifest=path_to_manifest,
+            force=force,
+        )
+        to_push = {slug for slug, _ in resource_zipped_with_path}
+        skipped = [slug for slug in resource_slugs if not slug in to_push]
+
+        if not resource_zipped_with_path:
+            logger.info(f"Nothing to push for {project_slug}.")
+            result = self._conclude_push(project_slug, [], skipped, manifest, digests)
+            result.stats = self.instrumentation.snapshot().since(before)
+            return result
+
+        # Keyed by slug, from a single (paginated) listing of the resources
+        resources = self.get_resource_index(project_slug)
+        logger.info(
+            f"Found {len(resources)} resource(s) for {project_slug}. Checking for missing resources and creating where necessary."
+        )
+        missing = [
+            slug for slug, _ in resource_zipped_with_path if not slug in resources
+        ]
+        if missing:
+            logger.info(f"{project_slug} is missing {missing}. Creating them.")
+
+        pushed = self.upload_journaled(
+            project_slug,
+            resource_zipped_with_path,
+            missing,
+            delta=delta,
+            path_to_journal=path_to_journal,
+            resume=resume,
+        )
+        result = self._conclude_push(project_slug, pushed, skipped, manifest, digests)
+        result.stats = self.instrumentation.snapshot().since(before)
+        return result
+
+    def push_files(
+        self,
+        *,
+        project_slug: str,
+        files: Iterable[tuple[str, str | Path]],
+        path_to_manifest: str | None = None,
+        force: bool = False,
+        delta: bool = False,
+        path_to_journal: str | None = None,
+        resume: bool = False,
+    ) -> PushResult:
+        """
+        Push the (resource_slug, path_to_file) pairs as they come, such as those of a scan of the file system
+        (see 'cli.extract_files'): each file is checked against the manifest and uploaded while the next ones
+        are still being produced. Missing resources are created. The other arguments are those of 'push'.
+        """
+        before = self.instrumentation.snapshot()
+        manifest = PushManifest(path_to_manifest) if path_to_manifest else None
+        skipped, digests = [], {}
+
+        def changed() -> Iterator[tuple[str, str]]:
+            for slug, path in files:
+                if manifest:
+                    digests[slug] = manifest.digest(project_slug, slug, path)
+                    if not force and manifest.is_unchanged(
+                        project_slug, slug, digests[slug]
+                    ):
+                        skipped.append(slug)
+                        continue
+                yield slug, str(path)
+
+        pushed = self.upload_journaled(
+            project_slug,
+            changed(),
+            None,
+            delta=delta,
+            path_to_journal=path_to_journal,
+            resume=resume,
+        )
+        if skipped:
+            logger.info(
+                f"Skipped {len(skipped)} unchanged resource(s) for {project_slug}."
+            )
+        result = self._conclude_push(project_slug, pushed, skipped, manifest, digests)
+        result.stats = self.instrumentation.snapshot().since(before)
+        return result
+
+    def upload_journaled(
+        self,
+        project_slug: str,
+        resource_zipped_with_path: Iterable[tuple[str, str]],
+        missing: list[str] | set[str] | None,
+        *,
+        delta: bool,
+        path_to_journal: str | None,
+        resume: bool,
+    ) -> list[tuple[str, bool, Any]]:
+        """'upload_sources', logging its progress to a journal when 'path_to_journal' is given"""
+        journal = Journal(path_to_journal, resume) if path_to_journal else None
+        pushed = None
+        try:
+            pushed = self.upload_sources(
+                project_slug,
+                resource_zipped_with_path,
+                missing,
+                delta=delta,
+                journal=journal,
+            )
+        finally:
+            if journal:
+                journal.close(
+                    pushed is not None and not has_failures([r for *_, r in pushed])
+                )
+        return pushed
+
+    def upload_sources(
+        self,
+        project_slug: str,
+        resource_zipped_with_path: Iterable[tuple[str, str]],
+        missing: list[str] | set[str] | None,
+        delta: bool = False,
+        journal: Journal | None = None,
+    ) -> list[tuple[str, bool, Any]]:
+        """
+        Upload the given (resource_slug, path_to_file) pairs as a pipeline: resources listed as 'missing' are created,
+        all upload jobs are submitted, then followed by a single coordinator until the server is done parsing them.
+        Pairs may come from an iterator, jobs being submitted as it goes; when 'missing' is None,
+        the resources missing are those not in the resource index of the project.
+        With 'delta', existing resources are updated string by string instead, without any job.
+        With a 'journal', files it records as uploaded (with the same content) are not uploaded again,
+        and the jobs it records as submitted are followed again rather than submitted anew.
+        Returns for each pair: the slug, whether its resource was created and the outcome of its upload
+        (job details or exception).
+        """
+        if missing is not None:
+            missing = set(missing)
+        # Filled in as the pairs come, by index
+        pairs, created, keys, res, todo = [], [], [], [], []
+        # Resources created so far by index, so that retrying an upload doesn't create its resource again
+        made: dict[int, Resource] = {}
+
+        def submit(
+            i: int, resource_slug: str, path_to_file: str
+        ) -> Resource | dict[str, int]:
+            if journal and (job_id := journal.jobs.get(keys[i])):
+                return tx_api.ResourceStringsAsyncUpload(id=job_id)
+
+            def refresh():
+                # Deleted since (hence to be created), or created since (hence to be updated)
+                made.pop(i, None)
+                created[i] = not resource_slug in self.get_resource_index(project_slug)
+
+            return self.refreshing(
+                project_slug, partial(upload, i, resource_slug, path_to_file), refresh
+            )
+
+        def upload(
+            i: int, resource_slug: str, path_to_file: str
+        ) -> Resource | dict[str, int]:
+            if delta and not created[i]:
+                details = self.update_source_strings(
+                    project_slug, resource_slug, path_to_file
+                )
+                if journal:
+                    journal.done(keys[i], details)
+                return details
+            if created[i]:
+                if not i in made:
+                    made[i] = self._create_empty_resource(
+                        project_slug=project_slug, resource_slug=resource_slug
+                    )
+                resource = made[i]
+            elif not (
+                resource := self.get_resource_index(project_slug).get(resource_slug)
+            ):
+                raise ValueError(
+                    f"Unable to find resource '{resource_slug}' in project '{project_slug}'"
+                )
+
+            job = self.submit_upload(resource, path_to_file)
+            if journal:
+                journal.submitted(keys[i], job.id)
+            return job
+
+        def tasks() -> Iterator[Callable]:
+            for slug, path in resource_zipped_with_path:
+                i = len(pairs)
+                pairs.append((slug, path))
+                created.append(
+                    slug in missing
+                    if missing is not None
+                    else not slug in self.get_resource_index(project_slug)
+                )
+                keys.append(
+                    f"{project_slug}:{slug}:{file_digest(path)}" if journal else ""
+                )
+                if journal and keys[i] in journal.completed:
+                    # Details of the upload as recorded when it completed
+                    res.append(journal.completed[keys[i]])
+                    continue
+                res.append(None)
+                todo.append(i)
+                yield partial(submit, i, slug, path)
+
+        submitted = self.run_concurrently(tasks())
+        if journal and len(todo) < len(pairs):
+            logger.info(f"Resuming: {len(pairs) - len(todo)} file(s) already uploaded.")
+        for i, r in zip(todo, submitted):
+            res[i] = r
+        # Resources updated string by string are already done
+        jobs = {i: job for i, job in zip(todo, submitted) if isinstance(job, Resource)}
+        logger.info(f"Submitted {len(jobs)} upload job(s) out of {len(todo)}.")
+
+        with ThreadPoolExecutor(self.max_workers) as polls:
+            for i, outcome in self.coordinator(polls, upload_outcome).run(jobs):
+                res[i] = outcome
+                if journal and isinstance(outcome, Exception):
+                    journal.failed(keys[i])
+                elif journal:
+                    journal.done(
+                        keys[i], outcome if isinstance(outcome, dict) else None
+                    )
+
+        return [(slug, c, r) for (slug, _), c, r in zip(pairs, created, res)]
+
+    def _plan_push(
+        self,
+        *,
+        project_slug: str,
+        resource_slugs: list[str],
+        path_to_files: list[str],
+        path_to_manifest: str | None,
+        force: bool,
+    ) -> tuple[list[tuple[str, str]], PushManifest | None, dict[str, str]]:
+        """(slug, path) pairs that need pushing, along with the push manifest if any"""
         if len(resource_slugs) != len(path_to_files):
             raise ValueError(
                 f"Resources slugs ({len(resource_slugs)}) and path to files ({len(path_to_files)}) must be equal in size!"
             )
 
         resource_zipped_with_path = list(zip(resource_slugs, path_to_files))
-        resources = self.list_resources(project_slug)
-        logger.info(
-            f"Found {len(resources)} resource(s) for {project_slug}. Checking for missing resources and creating where necessary."
+        manifest = PushManifest(path_to_manifest) if path_to_manifest else None
+        digests = (
+            {
+                slug: manifest.digest(project_slug, slug, path)
+                for slug, path in resource_zipped_with_path
+            }
+            if manifest
+            else {}
         )
-        created_when_missing_resource = []
 
-        for slug, path in resource_zipped_with_path:
-            logger.info(f"Slug: {slug}. Resources: {resources}.")
-            if not slug in resources:
+        if manifest and not force:
+            unchanged = {
+                slug
+                for slug, _ in resource_zipped_with_path
+                if manifest.is_unchanged(project_slug, slug, digests[slug])
+            }
+            if unchanged:
                 logger.info(
-                    f"{project_slug} is missing {slug}. Creating it from {path}."
+                    f"Skipping {len(unchanged)} unchanged resource(s) for {project_slug}: {sorted(unchanged)}"
                 )
-                self.create_resource(
-                    project_slug=project_slug, path_to_file=path, resource_slug=slug
-                )
-                created_when_missing_resource.append(slug)
+            resource_zipped_with_path = [
+                (slug, path)
+                for slug, path in resource_zipped_with_path
+                if not slug in unchanged
+            ]
 
-        args = [
-            tuple([project_slug, slug, path])
-            for slug, path in resource_zipped_with_path
-            if not slug in created_when_missing_resource
-        ]
+        return resource_zipped_with_path, manifest, digests
 
-        res = concurrently(
-            fn=self.update_source_translation,
-            args=args,
+    def _conclude_push(
+        self,
+        project_slug: str,
+        pushed: list[tuple[str, bool, Any]],
+        skipped: list[str],
+        manifest: PushManifest | None,
+        digests: dict[str, str],
+    ) -> PushResult:
+        """Record the resources pushed successfully in the manifest, and report on all of them"""
+        result = PushResult(
+            project_slug,
+            [PushedResource.from_upload(*p) for p in pushed]
+            + [PushedResource(slug, "skipped") for slug in skipped],
+        )
+
+        for failure in result.failed:
+            logger.error(f"Failed to push {failure.slug}: {failure.error}")
+        logger.info(str(result))
+
+        if manifest:
+            for slug, _, outcome in pushed:
+                if not isinstance(outcome, Exception):
+                    manifest.record(project_slug, slug, digests[slug])
+            manifest.to_disk()
+
+        return result
+
+    def run_concurrently(self, partials: Iterable[Callable]) -> list[Any]:
+        """
+        Run the tasks on a pool bounded by 'max_workers', sharing the client's retry policy.
+        Results are returned in the order of the tasks; a failed task yields its exception instead.
+        """
+        return concurrently(
+            partials=partials,
+            max_workers=self.max_workers,
+            retries=self.retries,
+            on_retry=partial(self.instrumentation.count, "retries"),
+            return_exceptions=True,
         )
 
-        logger.info(f"Pushed {args} for {len(res)} results.")
+
+# Statuses of the errors telling that the metadata looked up is outdated, see 'Client.refreshing'
+STALE_STATUS_CODES = {404, 409}
+
+# Attributes of a source string compared by 'update_source_strings', and the most items per bulk request
+SOURCE_STRING_FIELDS = ["strings", "pluralized", "developer_comment", "occurrences"]
+BULK_SIZE = 150
+
+
+def chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def compiler_pool() -> ProcessPoolExecutor:
+    """Pool compiling catalogs (see 'compile_mo'), spawned rather than forked from a process running threads"""
+    return ProcessPoolExecutor(mp_context=get_context("spawn"))
+
+
+def needs_compiling(path_to_po: str, written: bool) -> bool:
+    """Whether the MO file of the PO file is missing or outdated, given whether the PO file was just written"""
+    return written or not Path.exists(Path(f"{path_to_po}.mo"))
+
+
+def has_failures(results: list[Any]) -> bool:
+    return any(isinstance(r, Exception) for r in results)
+
+
+def raise_for_failures(operation: str, failures: list[tuple[str, Exception]]):
+    for name, error in failures:
+        logger.error(f"Failed to {operation} {name}: {error}")
+
+    raise TransifexException(
+        f"Failed to {operation} {len(failures)} item(s): {', '.join(name for name, _ in failures)}"
+    )
 
 
 class Transifex:
@@ -0,0 +1,336 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import monotonic
+from typing import Any, Callable
+
+from transifex.api.jsonapi.resources import Resource
+
+from pytransifex.api import Client
+from pytransifex.config import ApiConfig
+from pytransifex.instrumentation import Stats
+from pytransifex.interfaces import Tx
+from pytransifex.jobs import download_outcome, upload_outcome
+from pytransifex.results import PushResult
+from pytransifex.utils import with_retries
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient(Tx):
+    """
+    Asyncio counterpart of 'Client', meant to be awaited from an event loop.
+    Asynchronous jobs (translation downloads, source uploads) are polled from coroutines sleeping in between,
+    so thousands of them can be in flight at once. Only the individual HTTP requests, made through the SDK,
+    run on a pool of at most 'max_workers' threads.
+    Logging in, memoized metadata, bounds on requests (see 'Client.limit'), retry policy and instrumentation are those of the wrapped 'Client'.
+    """
+
+    def __init__(self, config: ApiConfig):
+        self.client = Client(config, defer_login=True)
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.max_workers, thread_name_prefix="pytransifex"
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *_):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the pool, retrying it if needed"""
+        task = with_retries(
+            partial(fn, *args, **kwargs),
+            retries=self.client.retries,
+            on_retry=partial(self.client.instrumentation.count, "retries"),
+        )
+        return await self.run_blocking(task)
+
+    async def run_blocking(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the pool as is, such as one working on local files"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(fn, *args, **kwargs)
+        )
+
+    async def wait_for(
+        self, job: Resource, outcome: Callable[[Resource], tuple[bool, Any]]
+    ) -> Any:
+        """Poll the job at growing intervals until 'outcome' tells it is done, then return its result"""
+        instrumentation = self.client.instrumentation
+        started_at = monotonic()
+        interval = self.client.poll_interval
+        while True:
+            done, result = await self.call(outcome, job)
+            if done:
+                instrumentation.record("queue", monotonic() - started_at)
+                return result
+
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, self.client.max_poll_interval)
+            with instrumentation.phase("poll", job=job.id):
+                await self.call(job.reload)
+
+    async def login(self):
+        await self.call(self.client.login)
+
+    async def create_project(self, *, project_slug: str, **kwargs):
+        """Create a project."""
+        return await self.call(
+            self.client.create_project, project_slug=project_slug, **kwargs
+        )
+
+    async def delete_project(self, project_slug: str):
+        return await self.call(self.client.delete_project, project_slug)
+
+    async def get_project(self, project_slug: str) -> None | Resource:
+        """Fetches the project matching the given slug"""
+        return await self.call(self.client.get_project, project_slug)
+
+    async def list_resources(self, project_slug: str) -> list[Any]:
+        """List all resources for the project passed as argument"""
+        return await self.call(self.client.list_resources, project_slug)
+
+    async def create_resource(
+        self,
+        *,
+        project_slug: str,
+        path_to_file: str,
+        resource_slug: str | None = None,
+        resource_name: str | None = None,
+        **kwargs,
+    ):
+        """Create a resource using the given file contents, slugs and names"""
+        if not (resource_slug or resource_name):
+            raise ValueError("Please give either a resource_slug or a resource_name")
+
+        resource = await self.call(
+            self.client._create_empty_resource,
+            project_slug=project_slug,
+            resource_slug=resource_slug,
+            resource_name=resource_name,
+            **kwargs,
+        )
+
+        job = await self.call(self.client.submit_upload, resource, path_to_file)
+        result = await self.wait_for(job, upload_outcome)
+        logger.info(f"Resource created: {resource_slug or resource_name}")
+        return result
+
+    async def update_source_translation(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        path_to_file: str,
+        delta: bool = False,
+    ):
+        """
+        Update the translation strings for the given resource using the content of the file
+        passsed as argument, see 'Client.update_source_translation'
+        """
+        if delta:
+            return await self.call(
+                self.client.update_source_strings,
+                project_slug,
+                resource_slug,
+                path_to_file,
+            )
+
+        job = await self.call(
+            self.client.submit_source_upload, project_slug, resource_slug, path_to_file
+        )
+        result = await self.wait_for(job, upload_outcome)
+        logger.info(f"Source updated for resource: {resource_slug}")
+        return result
+
+    async def get_translation(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        language_code: str,
+        path_to_output_file: None | str = None,
+        path_to_output_dir: None | str = None,
+    ) -> str:
+        """Fetch the translation resource matching the given language"""
+        language = await self.call(self.client.get_language, language_code)
+        path_to_output_file = Client.prepare_output_file(
+            resource_slug, language.code, path_to_output_file, path_to_output_dir
+        )
+        job = await self.call(
+            self.client.submit_translation_download,
+            project_slug,
+            resource_slug,
+            language,
+        )
+        url = await self.wait_for(job, download_outcome)
+
+        if await self.call(self.client.download, url, path_to_output_file):
+            logger.info(
+                f"Translations downloaded and written to file (resource: {resource_slug})"
+            )
+        return str(path_to_output_file)
+
+    async def list_languages(self, project_slug: str) -> list[str]:
+        """
+        List languages for which there exist translations under the given resource.
+        """
+        return await self.call(self.client.list_languages, project_slug)
+
+    async def create_language(
+        self,
+        *,
+        project_slug: str,
+        language_code: str,
+        coordinators: None | list[str] = None,
+    ):
+        """Create a new language resource in the remote Transifex repository"""
+        return await self.call(
+            self.client.create_language,
+            project_slug=project_slug,
+            language_code=language_code,
+            coordinators=coordinators,
+        )
+
+    async def project_exists(self, project_slug: str) -> bool:
+        """Check if the project exists in the remote Transifex repository"""
+        return await self.call(self.client.project_exists, project_slug)
+
+    async def ping(self) -> bool:
+        return await self.call(self.client.ping)
+
+    async def pull(
+        self,
+        *,
+        project_slug: str,
+        resource_slugs: list[str] | None = None,
+        language_codes: list[str] | None = None,
+        path_to_output_dir: str,
+        path_to_state: str | None = None,
+        force: bool = False,
+        by_language: bool = False,
+    ) -> Stats:
+        """Pull resources from project, see 'Client.pull'."""
+        before = self.client.instrumentation.snapshot()
+        args, state, stats = await self.call(
+            self.client._plan_pull,
+            project_slug=project_slug,
+            resource_slugs=resource_slugs,
+            language_codes=language_codes,
+            path_to_output_dir=path_to_output_dir,
+            path_to_state=path_to_state,
+            force=force,
+            by_language=by_language,
+        )
+        restored, args, _ = (
+            ([], args, [])
+            if force
+            else await self.run_blocking(
+                self.client.restore_from_store, project_slug, args, stats
+            )
+        )
+        res = await asyncio.gather(
+            *(
+                self.get_translation(p_slug, slug, l_code, None, out)
+                for p_slug, slug, l_code, out in args
+            ),
+            return_exceptions=True,
+        )
+        paths = [
+            self.client.prepare_output_file(slug, l_code, None, out)
+            for _, slug, l_code, out in restored
+        ]
+        # Hashing and copying the files into the store, away from the event loop
+        await self.run_blocking(
+            self.client._conclude_pull,
+            project_slug,
+            restored + args,
+            paths + list(res),
+            state,
+            stats,
+        )
+        return self.client.instrumentation.snapshot().since(before)
+
+    async def push(
+        self,
+        *,
+        project_slug: str,
+        resource_slugs: list[str],
+        path_to_files: list[str],
+        path_to_manifest: str | None = None,
+        force: bool = False,
+        delta: bool = False,
+    ) -> PushResult:
+        """Push resources with files under project, see 'Client.push'."""
+        before = self.client.instrumentation.snapshot()
+        resource_zipped_with_path, manifest, digests = await self.call(
+            self.client._plan_push,
+            project_slug=project_slug,
+            resource_slugs=resource_slugs,
+            path_to_files=path_to_files,
+            path_to_manifest=path_to_manifest,
+            force=force,
+        )
+        to_push = {slug for slug, _ in resource_zipped_with_path}
+        skipped = [slug for slug in resource_slugs if not slug in to_push]
+        resources = (
+            await self.call(self.client.get_resource_index, project_slug)
+            if resource_zipped_with_path
+            else {}
+        )
+        created = {slug: not slug in resources for slug, _ in resource_zipped_with_path}
+        # Resources created so far, so that retrying an upload doesn't create its resource again
+        made: dict[str, Resource] = {}
+
+        def submit(slug: str, path: str) -> Resource | dict[str, int]:
+            def refresh():
+                # Deleted since (hence to be created), or created since (hence to be updated)
+                made.pop(slug, None)
+                created[slug] = not slug in self.client.get_resource_index(project_slug)
+
+            def upload() -> Resource | dict[str, int]:
+                if delta and not created[slug]:
+                    return self.client.update_source_strings(project_slug, slug, path)
+                if created[slug]:
+                    if not slug in made:
+                        made[slug] = self.client._create_empty_resource(
+                            project_slug=project_slug, resource_slug=slug
+                        )
+                    resource = made[slug]
+                elif not (
+                    resource := self.client.get_resource_index(project_slug).get(slug)
+                ):
+                    raise ValueError(
+                        f"Unable to find resource '{slug}' in project '{project_slug}'"
+                    )
+                return self.client.submit_upload(resource, path)
+
+            return self.client.refreshing(project_slug, upload, refresh)
+
+        async def push_one(slug: str, path: str):
+            if created[slug]:
+                logger.info(
+                    f"{project_slug} is missing {slug}. Creating it from {path}."
+                )
+            job = await self.call(submit, slug, path)
+            if isinstance(job, dict):
+                # Updated string by string, without any job
+                return job
+            return await self.wait_for(job, upload_outcome)
+
+        res = await asyncio.gather(
+            *(push_one(slug, path) for slug, path in resource_zipped_with_path),
+            return_exceptions=True,
+        )
+        pushed = [
+            (slug, created[slug], r)
+            for (slug, _), r in zip(resource_zipped_with_path, res)
+        ]
+        result = await self.run_blocking(
+            self.client._conclude_push, project_slug, pushed, skipped, manifest, digests
+        )
+        result.stats = self.client.instrumentation.snapshot().since(before)
+        return result
@@ -1,31 +1,195 @@
 import logging
+import os
 import traceback
+from functools import cache, partial
 from os import mkdir, rmdir
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Sequence
 
 import click
 
-from pytransifex.api import Transifex
-from pytransifex.config import CliSettings
+from pytransifex.config import CliSettings, SyncProject
+
+if TYPE_CHECKING:
+    from pytransifex.api import Client
+    from pytransifex.instrumentation import Stats
 
 logger = logging.getLogger(__name__)
-client = Transifex(defer_login=True)
-assert client
 
 
-def path_to_slug(file_paths: list[Path]) -> list[str]:
-    keep_last = (str(f).split("/")[-1] for f in file_paths)
-    remove_dot = (s.split(".")[0] for s in keep_last)
-    return list(remove_dot)
+@cache
+def get_client() -> "Client":
+    """
+    Client shared by the commands, built on first use only:
+    importing the SDK and reading the environment are left to the commands that talk to Transifex.
+    """
+    from pytransifex.api import Transifex
+
+    client = Transifex(defer_login=True)
+    assert client
+    return client
 
 
-def extract_files(input_dir: Path) -> tuple[list[Path], list[str], str]:
-    files = list(Path.iterdir(input_dir))
-    slugs = path_to_slug(files)
-    files_status_report = "\n".join(
-        (f"file: {file} => slug: {slug}" for slug, file in zip(slugs, files))
+def path_to_slug(path_to_file: Path, input_dir: Path, slug_template: str) -> str:
+    """
+    Slug of the file according to the template, where '{stem}' is the name of the file up to its first dot,
+    '{name}' its full name, '{parent}' the name of its directory (empty at the top of the input directory)
+    and '{path}' its path relative to the input directory up to the stem, with '_' in place of '/'.
+    """
+    relative = path_to_file.relative_to(input_dir)
+    stem = relative.name.split(".")[0]
+    parent = relative.parent.as_posix()
+    return slug_template.format(
+        stem=stem,
+        name=relative.name,
+        parent=relative.parent.name,
+        path="_".join([*parent.split("/"), stem] if parent != "." else [stem]),
     )
-    return (files, slugs, files_status_report)
+
+
+def extract_files(
+    input_dir: Path,
+    include: Sequence[str] = ("*",),
+    exclude: Sequence[str] = (),
+    slug_template: str = "{stem}",
+) -> Iterator[tuple[str, Path]]:
+    """
+    Walk the input directory recursively and yield (slug, path) for each file as it is found, so that the files
+    can be pushed while the walk goes on (see 'Client.push_files').
+    Files are those matching one of the 'include' glob patterns and none of the 'exclude' ones, matched
+    against their path relative to the input directory as 'Path.match' does (from the right, '*.po'
+    matching at any depth); directories matching an 'exclude' pattern aren't entered.
+    Slugs follow 'slug_template' (see 'path_to_slug'), and two files can't have the same slug.
+    """
+    seen: dict[str, Path] = {}
+    directories = [input_dir]
+
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                path = Path(entry.path)
+                relative = path.relative_to(input_dir)
+                if any(relative.match(pattern) for pattern in exclude):
+                    continue
+
+                if entry.is_dir():
+                    directories.append(path)
+                elif entry.is_file() and any(relative.match(p) for p in include):
+                    slug = path_to_slug(path, input_dir, slug_template)
+                    if slug in seen:
+                        raise ValueError(
+                            f"Both {seen[slug]} and {path} have the slug '{slug}', see the slug template."
+                        )
+                    seen[slug] = path
+                    logger.debug(f"file: {path} => slug: {slug}")
+                    yield slug, path
+
+
+def use_metadata_cache(path_to_cache: Path, no_cache: bool, refresh: bool):
+    """
+    Share metadata with other invocations through the given file, and the catalog of languages
+    through another one next to it, unless told not to
+    """
+    if not no_cache:
+        client = get_client()
+        client.use_metadata_cache(path_to_cache, refresh=refresh)
+        client.path_to_language_cache = str(
+            path_to_cache.with_name(".pytx_languages.json")
+        )
+
+
+def sync_project(
+    client: "Client",
+    project: SyncProject,
+    state_directory: Path,
+    *,
+    push: bool,
+    pull: bool,
+    force: bool,
+    resume: bool = False,
+) -> str:
+    """Push the sources of the project, then pull its translations; return a report of what was done"""
+    report = []
+    slug = project.project_slug
+
+    if push and project.input_directory:
+        result = client.push_files(
+            project_slug=slug,
+            files=extract_files(
+                project.input_directory,
+                project.include,
+                project.exclude,
+                project.slug_template,
+            ),
+            path_to_manifest=str(
+                state_directory.joinpath(f".pytx_manifest.{slug}.json")
+            ),
+            force=force,
+            path_to_journal=str(
+                state_directory.joinpath(f".pytx_push_journal.{slug}.jsonl")
+            ),
+            resume=resume,
+        )
+        report.append(str(result))
+        report += [f"Failed to push {f.slug}: {f.error}" for f in result.failed]
+
+    if pull and project.output_directory:
+        client.pull(
+            project_slug=slug,
+            language_codes=project.language_codes,
+            path_to_output_dir=str(project.output_directory),
+            path_to_state=str(
+                state_directory.joinpath(f".pytx_pull_state.{slug}.json")
+            ),
+            force=force,
+            path_to_journal=str(
+                state_directory.joinpath(f".pytx_pull_journal.{slug}.jsonl")
+            ),
+            resume=resume,
+        )
+        report.append(f"Pulled {slug} to {project.output_directory}.")
+
+    return "\n".join(report)
+
+
+def sync_projects(
+    client: "Client",
+    projects: list[SyncProject],
+    state_directory: Path,
+    *,
+    push: bool = True,
+    pull: bool = True,
+    force: bool = False,
+    resume: bool = False,
+    max_projects: int | None = None,
+) -> tuple[dict[str, str | Exception], "Stats"]:
+    """
+    Sync all the projects with the same client -- hence the same login, connection pool and bounds on
+    its requests (see 'Client.limit') -- at most 'max_projects' at once.
+    Returns the report (or exception) of each project, and the overall stats.
+    """
+    from pytransifex.utils import concurrently
+
+    before = client.instrumentation.snapshot()
+    res = concurrently(
+        partials=[
+            partial(
+                sync_project,
+                client,
+                project,
+                state_directory,
+                push=push,
+                pull=pull,
+                force=force,
+                resume=resume,
+            )
+            for project in projects
+        ],
+        max_workers=max_projects,
+        return_exceptions=True,
+    )
+    reports = {project.project_slug: r for project, r in zip(projects, res)}
+    return reports, client.instrumentation.snapshot().since(before)
 
 
 @click.group
@@ -72,11 +236,77 @@ def init(**opts):
         settings.to_disk()
 
 
+@click.option(
+    "-f",
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Push every file, even those unchanged since the last push.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="Print the time spent per phase, the requests made and the bytes transferred.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Fetch the metadata of the project again, updating the local cache.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Neither read nor write the local cache of metadata.",
+)
+@click.option(
+    "-d",
+    "--delta",
+    is_flag=True,
+    default=False,
+    help="Only send the source strings that changed (PO files only).",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Take over from the last push if it was interrupted, instead of starting over.",
+)
+@click.option(
+    "--slug-template",
+    default="{stem}",
+    help="Slug of the resource of each file, from its '{stem}', '{name}', '{parent}' directory or relative '{path}'.",
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Glob pattern of the files (or directories) to leave out, may be repeated.",
+)
+@click.option(
+    "--include",
+    multiple=True,
+    default=["*"],
+    help="Glob pattern of the files to push, such as '*.po', may be repeated.",
+)
 @click.option("-in", "--input-directory", is_flag=False)
 @cli.command("push", help="Push translation strings")
-def push(input_directory: str | None):
+def push(
+    input_directory: str | None,
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    slug_template: str,
+    delta: bool,
+    force: bool,
+    resume: bool,
+    no_cache: bool,
+    refresh: bool,
+    stats: bool,
+):
     reply = ""
     settings = CliSettings.from_disk()
+    use_metadata_cache(settings.metadata_cache_file, no_cache, refresh)
     input_dir = (
         Path.cwd().joinpath(input_directory)
         if input_directory
@@ -89,15 +319,23 @@ def push(input_directory: str | None):
         )
 
     try:
-        files, slugs, files_status_report = extract_files(input_dir)
         click.echo(
-            f"cli:push > Pushing {files_status_report} to Transifex under project {settings.project_slug}."
+            f"cli:push > Pushing the files of {input_dir} to Transifex under project {settings.project_slug}."
         )
-        client.push(
+        result = get_client().push_files(
             project_slug=settings.project_slug,
-            resource_slugs=slugs,
-            path_to_files=[str(f) for f in files],
+            files=extract_files(input_dir, include, exclude, slug_template),
+            path_to_manifest=str(settings.manifest_file),
+            force=force,
+            delta=delta,
+            path_to_journal=str(settings.push_journal_file),
+            resume=resume,
         )
+        reply += f"cli:push > {result}"
+        for failure in result.failed:
+            reply += f"\ncli:push > Failed to push {failure.slug}: {failure.error}"
+        if stats:
+            reply += f"\ncli:push > Stats:\n{result.stats}"
     except Exception as error:
         reply += f"cli:push > Failed because of this error: {error}"
         logging.error(f"traceback: {traceback.print_exc()}")
@@ -106,33 +344,232 @@ def push(input_directory: str | None):
         settings.to_disk()
 
 
-@click.option("-l", "--only-lang", default="all")
+@click.option(
+    "-f",
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Pull every translation, even those unchanged since the last pull.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="Print the time spent per phase, the requests made and the bytes transferred.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Fetch the metadata of the project again, updating the local cache.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Neither read nor write the local cache of metadata.",
+)
+@click.option(
+    "--compile",
+    "compile_catalogs",
+    is_flag=True,
+    default=False,
+    help="Compile the PO files pulled to MO files, when their content changed.",
+)
+@click.option(
+    "--store/--no-store",
+    default=True,
+    help="Keep a copy of the translations pulled in a local store, and take those unchanged from there.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    default=False,
+    help="Write the translations last pulled from the local store, without connecting to Transifex.",
+)
+@click.option(
+    "--by-language",
+    is_flag=True,
+    default=False,
+    help="Check the translations language by language, to only download those with translated strings.",
+)
+@click.option(
+    "-l",
+    "--only-lang",
+    default=None,
+    help="Comma-separated language codes to pull, all the languages of the project if omitted.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Take over from the last pull if it was interrupted, instead of starting over.",
+)
 @click.option("-out", "--output-directory", is_flag=False)
 @cli.command("pull", help="Pull translation strings")
-def pull(output_directory: str | None, only_lang: str | None):
+def pull(
+    output_directory: str | None,
+    only_lang: str | None,
+    by_language: bool,
+    offline: bool,
+    store: bool,
+    compile_catalogs: bool,
+    force: bool,
+    resume: bool,
+    no_cache: bool,
+    refresh: bool,
+    stats: bool,
+):
     reply = ""
     settings = CliSettings.from_disk()
-    language_codes = only_lang.split(",") if only_lang else []
+    use_metadata_cache(settings.metadata_cache_file, no_cache, refresh)
+    get_client().use_store(settings.store_directory if store else None)
+    language_codes = only_lang.split(",") if only_lang and only_lang != "all" else None
 
     if output_directory:
         settings.output_directory = Path(output_directory)
     else:
         output_directory = str(settings.output_directory)
 
-    resource_slugs = []
     try:
         click.echo(
-            f"Pulling translation strings ({language_codes}) from project {settings.project_slug} to {str(output_directory)}..."
+            f"Pulling translation strings ({language_codes or 'all languages'}) from project {settings.project_slug} to {str(output_directory)}..."
         )
-        client.pull(
+        pull_stats = get_client().pull(
             project_slug=settings.project_slug,
-            resource_slugs=resource_slugs,
             language_codes=language_codes,
             path_to_output_dir=output_directory,
+            path_to_state=str(settings.pull_state_file),
+            force=force,
+            by_language=by_language,
+            path_to_journal=str(settings.pull_journal_file),
+            resume=resume,
+            offline=offline,
+            compile_catalogs=compile_catalogs,
         )
+        if stats:
+            reply += f"cli:pull > Stats:\n{pull_stats}"
     except Exception as error:
         reply += f"cli:pull > failed because of this error: {error}"
         logging.error(f"traceback: {traceback.print_exc()}")
     finally:
         click.echo(reply)
         settings.to_disk()
+
+
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="Print the time spent per phase, the requests made and the bytes transferred.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Fetch the metadata of the projects again, updating the local cache.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Neither read nor write the local cache of metadata.",
+)
+@click.option(
+    "-f",
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Push and pull everything, even what is unchanged since the last sync.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Take over from the last sync if it was interrupted, instead of starting over.",
+)
+@click.option(
+    "--store/--no-store",
+    default=True,
+    help="Keep a copy of the translations pulled in a local store, and take those unchanged from there.",
+)
+@click.option("--no-pull", is_flag=True, default=False, help="Only push sources.")
+@click.option("--no-push", is_flag=True, default=False, help="Only pull translations.")
+@click.option(
+    "--requests-per-second",
+    type=float,
+    default=None,
+    help="Most requests per second on average, all projects included (unlimited by default).",
+)
+@click.option(
+    "--max-workers",
+    type=int,
+    default=None,
+    help="Most requests in flight at once, all projects included.",
+)
+@click.option(
+    "-j",
+    "--max-projects",
+    type=int,
+    default=4,
+    help="How many projects to sync at once, sharing the bounds on requests.",
+)
+@click.option(
+    "-m",
+    "--manifest",
+    default=".pytx_sync.toml",
+    help="TOML file listing the projects to sync, see 'SyncProject.from_manifest'.",
+)
+@cli.command("sync", help="Push and pull many projects at once, listed in a manifest")
+def sync(
+    manifest: str,
+    max_projects: int,
+    max_workers: int | None,
+    requests_per_second: float | None,
+    no_push: bool,
+    no_pull: bool,
+    store: bool,
+    force: bool,
+    resume: bool,
+    no_cache: bool,
+    refresh: bool,
+    stats: bool,
+):
+    reply = ""
+    path_to_manifest = Path(manifest)
+    state_directory = path_to_manifest.parent
+
+    try:
+        projects = SyncProject.from_manifest(path_to_manifest)
+        click.echo(
+            f"cli:sync > Syncing {len(projects)} project(s), {max_projects} at once..."
+        )
+        use_metadata_cache(
+            state_directory.joinpath(".pytx_metadata.json"), no_cache, refresh
+        )
+        get_client().use_store(
+            state_directory.joinpath(".pytx_store") if store else None
+        )
+        get_client().limit(max_workers, requests_per_second)
+        reports, sync_stats = sync_projects(
+            get_client(),
+            projects,
+            state_directory,
+            push=not no_push,
+            pull=not no_pull,
+            force=force,
+            resume=resume,
+            max_projects=max_projects,
+        )
+        for slug, report in reports.items():
+            if isinstance(report, Exception):
+                reply += f"cli:sync > {slug} failed because of this error: {report}\n"
+            else:
+                reply += f"cli:sync > {slug}:\n{report}\n"
+        if stats:
+            reply += f"cli:sync > Stats:\n{sync_stats}"
+    except Exception as error:
+        reply += f"cli:sync > Failed because of this error: {error}"
+        logging.error(f"traceback: {traceback.print_exc()}")
+    finally:
+        click.echo(reply)
@@ -1,11 +1,8 @@
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from os import environ
 from pathlib import Path
 from typing import Any, NamedTuple
 
-import toml
-from dotenv import load_dotenv
-
 
 class ApiConfig(NamedTuple):
     api_token: str
@@ -13,9 +10,31 @@ class ApiConfig(NamedTuple):
     i18n_type: str
     host_name = "https://rest.api.transifex.com"
     project_slug: str | None = None
+    # Seconds after which memoized resources and languages are fetched again; never if None
+    cache_ttl: float | None = None
+    # Bounds on the concurrent calls of a client: pool size (Python's default if None),
+    # shared rate limit (unlimited if None) and retries of rate-limited or failing calls
+    max_workers: int | None = None
+    requests_per_second: float | None = None
+    retries: int = 3
+    # Seconds between two polls of an asynchronous job, growing up to the maximum while it's pending
+    poll_interval: float = 1.0
+    max_poll_interval: float = 5.0
+    # JSON file keeping metadata across processes (none if None), and seconds after which its entries expire
+    path_to_metadata_cache: str | None = None
+    metadata_ttl: float | None = 3600.0
+    # Directory keeping a copy of every translation pulled, see 'TranslationStore' (none if None)
+    path_to_store: str | None = None
+    # JSON file keeping the catalog of the languages of Transifex across processes (none if None),
+    # and seconds after which the catalog is loaded again, see 'LanguageRegistry'
+    path_to_language_cache: str | None = None
+    language_ttl: float | None = 7 * 24 * 3600.0
 
     @classmethod
     def from_env(cls) -> "ApiConfig":
+        # Imported when needed only, to keep the CLI quick to start
+        from dotenv import load_dotenv
+
         load_dotenv()
 
         token = environ.get("TX_TOKEN")
@@ -80,10 +99,44 @@ class CliSettings:
 
     @classmethod
     def from_disk(cls) -> "CliSettings":
+        import toml
+
         d = toml.load(cls.config_file)
         return cls.extract_settings(**d)
 
+    @property
+    def manifest_file(self) -> Path:
+        """Where 'pytx push' keeps track of the files it already pushed, next to the config file"""
+        return Path(self.config_file).parent.joinpath(".pytx_manifest.json")
+
+    @property
+    def pull_state_file(self) -> Path:
+        """Where 'pytx pull' keeps track of the translations it already pulled, next to the config file"""
+        return Path(self.config_file).parent.joinpath(".pytx_pull_state.json")
+
+    @property
+    def push_journal_file(self) -> Path:
+        """Where 'pytx push' logs its progress, to be resumed with 'pytx push --resume' if interrupted"""
+        return Path(self.config_file).parent.joinpath(".pytx_push_journal.jsonl")
+
+    @property
+    def pull_journal_file(self) -> Path:
+        """Where 'pytx pull' logs its progress, to be resumed with 'pytx pull --resume' if interrupted"""
+        return Path(self.config_file).parent.joinpath(".pytx_pull_journal.jsonl")
+
+    @property
+    def store_directory(self) -> Path:
+        """Where 'pytx pull' keeps a copy of the translations it pulled, next to the config file"""
+        return Path(self.config_file).parent.joinpath(".pytx_store")
+
+    @property
+    def metadata_cache_file(self) -> Path:
+        """Where the CLI keeps the metadata fetched from Transifex, next to the config file"""
+        return Path(self.config_file).parent.joinpath(".pytx_metadata.json")
+
     def to_disk(self):
+        import toml
+
         with open(self.config_file, "w") as fh:
             toml.dump(self.serialize(), fh)
 
@@ -104,3 +157,59 @@ class CliSettings:
         if k in truthy_obj:
             return truthy_obj[k]
         return defaults[k]
+
+
+@dataclass
+class SyncProject:
+    """One of the projects listed in the manifest of 'pytx sync'"""
+
+    project_slug: str
+    input_directory: Path | None = None
+    output_directory: Path | None = None
+    # All the languages of the project if None
+    language_codes: list[str] | None = None
+    # Files of the input directory to push and their slugs, see 'cli.extract_files'
+    include: list[str] = field(default_factory=lambda: ["*"])
+    exclude: list[str] = field(default_factory=list)
+    slug_template: str = "{stem}"
+
+    @classmethod
+    def from_manifest(cls, path_to_manifest: str | Path) -> list["SyncProject"]:
+        """
+        Projects listed as '[[projects]]' tables in the TOML manifest, such as:
+
+            [[projects]]
+            project_slug = "my_plugin"
+            input_directory = "my_plugin/i18n/source"
+            output_directory = "my_plugin/i18n"
+            language_codes = ["fr", "de"]
+            include = ["*.po"]
+            exclude = ["build"]
+            slug_template = "{parent}_{stem}"
+
+        Relative directories are relative to the manifest.
+        """
+        import toml
+
+        path_to_manifest = Path(path_to_manifest)
+        d = toml.load(path_to_manifest)
+        resolve = lambda v: path_to_manifest.parent.joinpath(v) if v else None
+
+        projects = []
+        for i, project in enumerate(d.get("projects", [])):
+            if not project.get("project_slug"):
+                raise ValueError(
+                    f"Project #{i + 1} of {path_to_manifest} has no 'project_slug'."
+                )
+            projects.append(
+                cls(
+                    project["project_slug"],
+                    resolve(project.get("input_directory")),
+                    resolve(project.get("output_directory")),
+                    project.get("language_codes"),
+                    project.get("include", ["*"]),
+                    project.get("exclude", []),
+                    project.get("slug_template", "{stem}"),
+                )
+            )
+        return projects
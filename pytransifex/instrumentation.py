@@ -0,0 +1,101 @@
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Iterator
+
+# Called with the name of a phase and its attributes (resource, language...) when it starts,
+# returning a context manager exited when it ends -- such as OpenTelemetry's 'Tracer.start_as_current_span'
+Hook = Callable[..., ContextManager]
+
+
+@dataclass
+class Stats:
+    """Totals recorded by an 'Instrumentation': seconds spent and calls made per phase, plus counters"""
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+    # Such as 'requests', 'retries', 'bytes_downloaded' and 'bytes_uploaded'
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def since(self, before: "Stats") -> "Stats":
+        """What was recorded between 'before' and these stats"""
+        diff = lambda now, then: {
+            k: v - then.get(k, 0) for k, v in now.items() if v != then.get(k, 0)
+        }
+        return Stats(
+            diff(self.seconds, before.seconds),
+            diff(self.calls, before.calls),
+            diff(self.counters, before.counters),
+        )
+
+    def __str__(self) -> str:
+        lines = [
+            f"{phase}: {self.calls.get(phase, 0)} call(s), {seconds:.2f}s"
+            for phase, seconds in sorted(self.seconds.items())
+        ]
+        lines += [f"{name}: {n}" for name, n in sorted(self.counters.items())]
+        return "\n".join(lines)
+
+
+class Instrumentation:
+    """
+    Times the phases of the work of a client (login, metadata lookups, job submissions, queueing, polling,
+    file transfers) and counts its requests, retries and bytes transferred.
+    Phases are also reported to the hooks added, so that each call can be traced individually.
+    Thread-safe: phases of concurrent calls are recorded from the threads running them.
+    """
+
+    def __init__(self):
+        self.hooks: list[Hook] = []
+        self._stats = Stats()
+        self._lock = Lock()
+
+    def add_hook(self, hook: Hook):
+        self.hooks.append(hook)
+
+    @contextmanager
+    def phase(self, name: str, **attributes) -> Iterator[None]:
+        with ExitStack() as stack:
+            for hook in self.hooks:
+                stack.enter_context(hook(name, attributes=attributes))
+
+            start = perf_counter()
+            try:
+                yield
+            finally:
+                self.record(name, perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        """Account for a phase timed by the caller"""
+        with self._lock:
+            self._stats.seconds[name] = self._stats.seconds.get(name, 0.0) + seconds
+            self._stats.calls[name] = self._stats.calls.get(name, 0) + 1
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self._stats.counters[name] = self._stats.counters.get(name, 0) + n
+
+    def snapshot(self) -> Stats:
+        with self._lock:
+            return Stats(
+                dict(self._stats.seconds),
+                dict(self._stats.calls),
+                dict(self._stats.counters),
+            )
+
+    def attach(self, api: Any):
+        """
+        Count and time the HTTP requests of the SDK's API connection, in place of those of any other
+        instrumentation attached before: like its host and credentials, the connection is shared process-wide.
+        """
+        request = type(api).request
+
+        @wraps(request)
+        def counted_request(method: str, url: str, *args, **kwargs):
+            self.count("requests")
+            with self.phase("request", method=method.upper(), url=url):
+                return request(api, method, url, *args, **kwargs)
+
+        api.request = counted_request
@@ -0,0 +1,129 @@
+"""
+Submission and inspection of the asynchronous jobs of the Transifex API, split apart so that callers
+decide how and when to poll -- unlike the SDK's 'download' and 'upload' which block until the job is done.
+"""
+from concurrent.futures import Executor, as_completed
+from functools import partial
+from time import monotonic, sleep
+from typing import Any, Callable, Hashable, Iterator
+
+from transifex.api import transifex_api as tx_api
+from transifex.api.exceptions import DownloadException, UploadException
+from transifex.api.jsonapi.resources import Resource
+
+from pytransifex.instrumentation import Instrumentation
+from pytransifex.utils import RateLimiter, with_retries
+
+
+def submit_download(resource: Resource, language: Resource) -> Resource:
+    return tx_api.ResourceTranslationsAsyncDownload.create(
+        resource=resource, language=language
+    )
+
+
+def submit_upload(resource: Resource, content: str | bytes) -> Resource:
+    return tx_api.ResourceStringsAsyncUpload.create_with_form(
+        data={"resource": resource.id}, files={"content": content}
+    )
+
+
+def download_outcome(job: Resource) -> tuple[bool, str | None]:
+    """Whether the download job is done, and if so the URL of the translated file"""
+    if errors := job.attributes.get("errors"):
+        raise DownloadException(errors[0]["detail"], errors)
+    if job.redirect:
+        return True, job.redirect
+    return False, None
+
+
+def upload_outcome(job: Resource) -> tuple[bool, Any]:
+    """Whether the upload job is done, and if so what it resulted in (the resource or the job details)"""
+    if errors := job.attributes.get("errors"):
+        raise UploadException(errors[0]["detail"], errors)
+    if job.redirect:
+        return True, job.follow()
+    if job.attributes.get("status") == "succeeded":
+        return True, job.attributes.get("details")
+    return False, None
+
+
+class JobCoordinator:
+    """
+    Follows many asynchronous jobs at once from a single loop: jobs are polled when due, at intervals growing
+    from 'poll_interval' to 'max_poll_interval' while they remain pending, with the polls themselves
+    running on the given pool. Jobs are reported as soon as they are done, so that their results can be
+    processed while other jobs are still running.
+    With an 'instrumentation', polls are timed as the 'poll' phase, and the time each job spent
+    pending since the start of 'run' as the 'queue' phase.
+    """
+
+    def __init__(
+        self,
+        pool: Executor,
+        outcome: Callable[[Resource], tuple[bool, Any]],
+        *,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 5.0,
+        rate_limiter: RateLimiter | None = None,
+        retries: int = 0,
+        instrumentation: Instrumentation | None = None,
+    ):
+        self.pool = pool
+        self.instrumentation = instrumentation
+        self.poll = with_retries(
+            partial(self.reload_and_check, outcome=outcome),
+            rate_limiter=rate_limiter,
+            retries=retries,
+            on_retry=partial(instrumentation.count, "retries")
+            if instrumentation
+            else None,
+        )
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    def reload_and_check(self, job: Resource, *, outcome: Callable) -> tuple[bool, Any]:
+        if self.instrumentation:
+            with self.instrumentation.phase("poll", job=job.id):
+                job.reload()
+        else:
+            job.reload()
+        return outcome(job)
+
+    def run(self, jobs: dict[Hashable, Resource]) -> Iterator[tuple[Hashable, Any]]:
+        """
+        Yield (key, result) for each of the jobs as it gets done,
+        where the result of a failed job is the exception it failed with.
+        """
+        started_at = monotonic()
+        # Key -> (job, current polling interval, time at which the job is due for polling)
+        pending = {
+            key: (job, self.poll_interval, monotonic() + self.poll_interval)
+            for key, job in jobs.items()
+        }
+
+        while pending:
+            now = monotonic()
+            due = [key for key, (_, _, due_at) in pending.items() if due_at <= now]
+
+            if not due:
+                sleep(min(due_at for _, _, due_at in pending.values()) - now)
+                continue
+
+            polls = {self.pool.submit(self.poll, pending[key][0]): key for key in due}
+
+            for future in as_completed(polls):
+                key = polls[future]
+                job, interval, _ = pending.pop(key)
+
+                try:
+                    done, result = future.result()
+                except Exception as error:
+                    done, result = True, error
+
+                if done:
+                    if self.instrumentation:
+                        self.instrumentation.record("queue", monotonic() - started_at)
+                    yield key, result
+                else:
+                    interval = min(interval * 1.5, self.max_poll_interval)
+                    pending[key] = (job, interval, monotonic() + interval)
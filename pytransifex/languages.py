@@ -0,0 +1,109 @@
+"""
+Language codes and the catalog of the languages of Transifex, shared by the clients of a process (see 'registry').
+"""
+import re
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Callable
+
+from pytransifex.state import MetadataCache
+
+LANGUAGE_CODE = re.compile(r"^([A-Za-z]{2,3})((?:[_-][A-Za-z0-9]{2,8})*)(@[A-Za-z]+)?$")
+
+
+def normalize_language_code(language_code: str) -> str:
+    """
+    Code of the language as Transifex spells it: 'fr-FR', 'fr_fr' and 'FR-fr' all become 'fr_FR',
+    'zh-hans' becomes 'zh_Hans'. Raises a ValueError for what can't be a language code.
+    """
+    if not (match := LANGUAGE_CODE.match(language_code.strip())):
+        raise ValueError(f"Invalid language code: '{language_code}'")
+
+    base, subtags, variant = match.groups()
+    parts = [base.lower()]
+    for tag in re.split("[_-]", subtags)[1:]:
+        if len(tag) == 2 and tag.isalpha():
+            # Region
+            parts.append(tag.upper())
+        elif len(tag) == 4 and tag.isalpha():
+            # Script
+            parts.append(tag.title())
+        else:
+            parts.append(tag)
+    return "_".join(parts) + (variant or "").lower()
+
+
+def language_key(language_code: str) -> str:
+    """Key under which a code spelled by Transifex is looked up: the code normalized, if it can be"""
+    try:
+        return normalize_language_code(language_code)
+    except ValueError:
+        return language_code
+
+
+class LanguageRegistry:
+    """
+    The languages of Transifex by normalized code (see 'language_key'), as JSON:API documents: the whole catalog is loaded at once,
+    in a single (paginated) listing, then codes are resolved locally.
+    The catalog can also be kept in a file, so that other processes don't load it again before it expires.
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self.languages: dict[str, dict[str, Any]] = {}
+        self.loaded_at: float | None = None
+        self.lock = Lock()
+
+    def resolve(
+        self,
+        language_code: str,
+        fetch: Callable[[], list[dict[str, Any]]],
+        path_to_cache: str | Path | None = None,
+        ttl: float | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Language of the normalized code, None if not in the catalog; its own code is spelled as Transifex does.
+        The catalog is loaded with 'fetch' (or from 'path_to_cache') on first use, and again once older than 'ttl' seconds.
+        """
+        with self.lock:
+            if self.loaded_at is None or (
+                ttl is not None and time() - self.loaded_at >= ttl
+            ):
+                self.load(fetch, path_to_cache, ttl)
+            return self.languages.get(language_code)
+
+    def load(
+        self,
+        fetch: Callable[[], list[dict[str, Any]]],
+        path_to_cache: str | Path | None,
+        ttl: float | None,
+    ):
+        cache = MetadataCache(path_to_cache, ttl) if path_to_cache else None
+        if cache and (languages := cache.get("languages")) is not None:
+            loaded_at = cache.entries["languages"]["fetched_at"]
+        else:
+            languages = {language["id"]: language for language in fetch()}
+            loaded_at = time()
+            if cache:
+                cache.set("languages", languages)
+
+        self.languages = {
+            language_key(language["attributes"]["code"]): language
+            for language in languages.values()
+        }
+        self.loaded_at = loaded_at
+
+    def add(self, language: dict[str, Any]):
+        """Add a language missing from the catalog loaded, such as one added to Transifex since"""
+        with self.lock:
+            self.languages[language_key(language["attributes"]["code"])] = language
+
+    def clear(self):
+        with self.lock:
+            self.languages = {}
+            self.loaded_at = None
+
+
+# Shared by all the clients of the process, like the connection of the SDK
+registry = LanguageRegistry()
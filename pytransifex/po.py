@@ -0,0 +1,141 @@
+"""
+Minimal reader of gettext PO catalogs: enough to diff source strings against Transifex (see 'Client.update_source_strings')
+and to compile catalogs to MO files, without depending on gettext tools.
+"""
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+KEYWORD = re.compile(r'^(msgctxt|msgid_plural|msgid|msgstr(?:\[(\d+)\])?)\s+"(.*)"$')
+MO_MAGIC = 0x950412DE
+
+
+@dataclass
+class PoEntry:
+    msgid: str
+    # Translations by plural form, the only form of a singular message being 0
+    msgstr: dict[int, str] = field(default_factory=dict)
+    msgctxt: str | None = None
+    msgid_plural: str | None = None
+    flags: set[str] = field(default_factory=set)
+    # Extracted ('#.') comments and references ('#:')
+    comments: list[str] = field(default_factory=list)
+    occurrences: list[str] = field(default_factory=list)
+
+    @property
+    def is_header(self) -> bool:
+        return not self.msgid and not self.msgctxt
+
+    @property
+    def fuzzy(self) -> bool:
+        return "fuzzy" in self.flags
+
+    def source_strings(self) -> dict[str, str]:
+        """Source strings as Transifex holds them, by plural rule"""
+        if self.msgid_plural is None:
+            return {"other": self.msgid}
+        return {"one": self.msgid, "other": self.msgid_plural}
+
+
+def unescape(s: str) -> str:
+    return re.sub(r"\\(.)", lambda m: ESCAPES.get(m.group(1), m.group(0)), s)
+
+
+def read_po(path_to_file: str | Path) -> list[PoEntry]:
+    """Entries of the catalog, header included, leaving out obsolete ('#~') entries"""
+    with open(path_to_file, "r", encoding="utf-8") as fh:
+        return list(parse_po(fh))
+
+
+def parse_po(lines: Iterator[str]) -> Iterator[PoEntry]:
+    entry = PoEntry("")
+    # Name (and plural form) of the keyword whose string the continuation lines add to
+    current: tuple[str, int | None] | None = None
+    has_msgid = False
+
+    def append(keyword: str, index: int | None, s: str):
+        if keyword == "msgstr":
+            index = index or 0
+            entry.msgstr[index] = entry.msgstr.get(index, "") + s
+        else:
+            setattr(entry, keyword, (getattr(entry, keyword) or "") + s)
+
+    for line in lines:
+        line = line.strip()
+
+        if not line or line.startswith("#~"):
+            continue
+
+        if line.startswith("#"):
+            # Comments come first: one here after strings starts a new entry
+            if has_msgid and entry.msgstr:
+                yield entry
+                entry, current, has_msgid = PoEntry(""), None, False
+            if line.startswith("#,"):
+                entry.flags |= {f.strip() for f in line[2:].split(",") if f.strip()}
+            elif line.startswith("#."):
+                entry.comments.append(line[2:].strip())
+            elif line.startswith("#:"):
+                entry.occurrences += line[2:].split()
+            continue
+
+        if match := KEYWORD.match(line):
+            keyword, index, s = match.groups()
+            keyword = keyword.split("[")[0]
+            if keyword in ["msgctxt", "msgid"] and has_msgid and entry.msgstr:
+                yield entry
+                entry, has_msgid = PoEntry(""), False
+            has_msgid = has_msgid or keyword == "msgid"
+            current = (keyword, int(index) if index else None)
+            append(*current, unescape(s))
+        elif line.startswith('"') and line.endswith('"') and current:
+            append(*current, unescape(line[1:-1]))
+        else:
+            raise ValueError(f"Unable to parse this line of a PO file: {line}")
+
+    if has_msgid:
+        yield entry
+
+
+def compile_mo(path_to_po: str | Path, path_to_mo: str | Path | None = None) -> str:
+    """
+    Compile the catalog to a binary MO file ('path_to_po' with a '.mo' suffix added by default), as 'msgfmt' does:
+    fuzzy and untranslated messages are left out. Returns the path to the MO file, written atomically.
+    Top-level so that it can run in a process pool.
+    """
+    path = Path(path_to_mo or f"{path_to_po}.mo")
+    messages = {}
+    for entry in read_po(path_to_po):
+        if not entry.is_header and (entry.fuzzy or not any(entry.msgstr.values())):
+            continue
+        msgid = entry.msgid
+        if entry.msgctxt is not None:
+            msgid = f"{entry.msgctxt}\x04{msgid}"
+        if entry.msgid_plural is not None:
+            msgid = f"{msgid}\0{entry.msgid_plural}"
+        msgstr = "\0".join(entry.msgstr[k] for k in sorted(entry.msgstr))
+        messages[msgid.encode()] = msgstr.encode()
+
+    keys = sorted(messages)
+    # Header, then the tables of (length, offset) of the original and translated strings, then the strings
+    offset = 28 + 16 * len(keys)
+    table, data = [], bytearray()
+    for string in keys + [messages[k] for k in keys]:
+        table.append((len(string), offset + len(data)))
+        data += string + b"\0"
+
+    content = bytearray(
+        struct.pack("<7I", MO_MAGIC, 0, len(keys), 28, 28 + 8 * len(keys), 0, 0)
+    )
+    for length, start in table:
+        content += struct.pack("<2I", length, start)
+    content += data
+
+    path_to_temp = path.with_name(f".{path.name}.{os.getpid()}.part")
+    path_to_temp.write_bytes(content)
+    os.replace(path_to_temp, path)
+    return str(path)
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from pytransifex.instrumentation import Stats
+
+
+@dataclass
+class PushedResource:
+    """What happened to one resource during a push"""
+
+    slug: str
+    # One of 'created', 'updated', 'skipped' or 'failed'
+    status: str
+    strings_created: int = 0
+    strings_updated: int = 0
+    strings_deleted: int = 0
+    error: Exception | None = None
+
+    @classmethod
+    def from_upload(cls, slug: str, created: bool, result: Any) -> "PushedResource":
+        """Build from the outcome of an upload job: its details, the resource it redirected to, or an exception"""
+        if isinstance(result, Exception):
+            return cls(slug, "failed", error=result)
+
+        details = result if isinstance(result, dict) else {}
+        return cls(
+            slug,
+            "created" if created else "updated",
+            strings_created=details.get("strings_created", 0),
+            strings_updated=details.get("strings_updated", 0),
+            strings_deleted=details.get("strings_deleted", 0),
+        )
+
+
+@dataclass
+class PushResult:
+    """Per-resource report of a push"""
+
+    project_slug: str
+    resources: list[PushedResource] = field(default_factory=list)
+    # Timings and counters of the push, see 'Instrumentation'
+    stats: Stats | None = None
+
+    def with_status(self, status: str) -> list[PushedResource]:
+        return [r for r in self.resources if r.status == status]
+
+    @property
+    def failed(self) -> list[PushedResource]:
+        return self.with_status("failed")
+
+    def __str__(self) -> str:
+        counts = ", ".join(
+            f"{len(self.with_status(s))} {s}"
+            for s in ["created", "updated", "skipped", "failed"]
+        )
+        strings = ", ".join(
+            f"{sum(getattr(r, f'strings_{s}') for r in self.resources)} {s}"
+            for s in ["created", "updated", "deleted"]
+        )
+        return (
+            f"Pushed to {self.project_slug}: {counts} resource(s); strings {strings}."
+        )
@@ -0,0 +1,343 @@
+import hashlib
+import json
+import os
+import shutil
+from filecmp import cmp
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Any
+from uuid import uuid4
+
+
+def file_digest(path_to_file: str | Path, chunk_size: int = 1 << 16) -> str:
+    """Hash the bytes of the file passed as argument, reading it in chunks"""
+    digest = hashlib.sha256()
+    with open(path_to_file, "rb") as fh:
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_json_atomically(path: Path, content: Any):
+    """Write 'content' as JSON to a temporary sibling of 'path', then rename it into place"""
+    Path.mkdir(path.parent, parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as fh:
+        json.dump(content, fh, indent=2, sort_keys=True)
+    os.replace(fh.name, path)
+
+
+class JsonState:
+    """Nested dictionary persisted as a JSON file, loaded on creation if the file exists"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.entries: dict[str, Any] = {}
+
+        if Path.exists(self.path):
+            with open(self.path, "r") as fh:
+                self.entries = json.load(fh)
+
+    def to_disk(self):
+        write_json_atomically(self.path, self.entries)
+
+
+class PushManifest(JsonState):
+    """
+    Local record of the source files last pushed for each (project, resource) pair, as a content hash.
+    'Client.push' uses it to skip unchanged files before any network call is made.
+    The size and modification time of the files are recorded too, so that files left untouched since
+    aren't even read again (see 'digest').
+    """
+
+    def __init__(self, path: str | Path):
+        super().__init__(path)
+        # (project, resource) -> (size, mtime) of the file as it was when hashed by 'digest'
+        self.observed: dict[tuple[str, str], tuple[int, int]] = {}
+
+    def digest(
+        self, project_slug: str, resource_slug: str, path_to_file: str | Path
+    ) -> str:
+        """Hash of the file, as recorded if its size and modification time are the same as then"""
+        stat = os.stat(path_to_file)
+        observed = (stat.st_size, stat.st_mtime_ns)
+        self.observed[(project_slug, resource_slug)] = observed
+
+        entry = self.get(project_slug, resource_slug)
+        if entry and (entry.get("size"), entry.get("mtime_ns")) == observed:
+            return entry["hash"]
+        return file_digest(path_to_file)
+
+    def get(self, project_slug: str, resource_slug: str) -> dict[str, Any] | None:
+        return self.entries.get(project_slug, {}).get(resource_slug)
+
+    def is_unchanged(self, project_slug: str, resource_slug: str, digest: str) -> bool:
+        if entry := self.get(project_slug, resource_slug):
+            return entry.get("hash") == digest
+        return False
+
+    def record(self, project_slug: str, resource_slug: str, digest: str):
+        entry: dict[str, Any] = {"hash": digest}
+        if observed := self.observed.get((project_slug, resource_slug)):
+            entry["size"], entry["mtime_ns"] = observed
+        self.entries.setdefault(project_slug, {})[resource_slug] = entry
+
+
+class PullState(JsonState):
+    """
+    Local record of the language statistics of each (project, resource, language) triple
+    as they were when its translation was last pulled.
+    'Client.pull' uses it to only download the translations that changed since.
+    """
+
+    tracked_stats = (
+        "last_update",
+        "total_strings",
+        "translated_strings",
+        "reviewed_strings",
+        "proofread_strings",
+    )
+
+    def get(
+        self, project_slug: str, resource_slug: str, language_code: str
+    ) -> dict[str, Any] | None:
+        return (
+            self.entries.get(project_slug, {}).get(resource_slug, {}).get(language_code)
+        )
+
+    def is_unchanged(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        language_code: str,
+        stats: dict[str, Any],
+    ) -> bool:
+        if entry := self.get(project_slug, resource_slug, language_code):
+            return entry == self.summarize(stats)
+        return False
+
+    def record(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        language_code: str,
+        stats: dict[str, Any],
+    ):
+        self.entries.setdefault(project_slug, {}).setdefault(resource_slug, {})[
+            language_code
+        ] = self.summarize(stats)
+
+    @classmethod
+    def summarize(cls, stats: dict[str, Any]) -> dict[str, Any]:
+        return {k: stats.get(k) for k in cls.tracked_stats}
+
+
+class MetadataCache(JsonState):
+    """
+    Organization, project, resource and language metadata as last fetched from Transifex, shared across processes
+    through the file system so that back-to-back commands don't look the same things up again.
+    Entries older than 'ttl' seconds (never if 'ttl' is None) are ignored, and replaced once fetched again.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None):
+        super().__init__(path)
+        self.ttl = ttl
+        self.lock = Lock()
+
+    def get(self, key: str) -> Any | None:
+        if entry := self.entries.get(key):
+            if self.ttl is None or time() - entry["fetched_at"] < self.ttl:
+                return entry["data"]
+        return None
+
+    def set(self, key: str, data: Any):
+        with self.lock:
+            self.entries[key] = {"fetched_at": time(), "data": data}
+            self.to_disk()
+
+    def pop(self, *keys: str):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+            self.to_disk()
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+            self.to_disk()
+
+
+class TranslationStore(JsonState):
+    """
+    Local copy of every translation file pulled, shared across output directories and runs.
+    Files are kept once per content under 'objects/', named after their hash, and indexed by
+    (project, resource, language) along with the revision of the translation ('last_update' of its language
+    statistics) they were pulled at: a translation still at that revision is then taken from the store
+    instead of being downloaded again, and a whole output tree can be rebuilt without any network.
+    """
+
+    def __init__(self, path_to_store: str | Path):
+        self.root = Path(path_to_store)
+        super().__init__(self.root.joinpath("index.json"))
+        self.lock = Lock()
+
+    def path_to_object(self, digest: str) -> Path:
+        return self.root.joinpath("objects", digest[:2], digest)
+
+    def get(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        language_code: str,
+        revision: str | None = None,
+    ) -> Path | None:
+        """The stored file of the translation, provided it's at the given revision (if any)"""
+        entry = (
+            self.entries.get(project_slug, {}).get(resource_slug, {}).get(language_code)
+        )
+        if entry and (revision is None or entry["revision"] == revision):
+            path = self.path_to_object(entry["hash"])
+            if Path.exists(path):
+                return path
+        return None
+
+    def put(
+        self,
+        project_slug: str,
+        resource_slug: str,
+        language_code: str,
+        revision: str,
+        path_to_file: str | Path,
+    ):
+        """Store the file of the translation at the given revision, unless already stored"""
+        if self.get(project_slug, resource_slug, language_code, revision):
+            return
+
+        digest = file_digest(path_to_file)
+        path = self.path_to_object(digest)
+        # Written and indexed at once, so that 'prune' doesn't see it unreferenced
+        with self.lock:
+            if not Path.exists(path):
+                Path.mkdir(path.parent, parents=True, exist_ok=True)
+                with NamedTemporaryFile(
+                    dir=path.parent, prefix=f".{digest}.", delete=False
+                ) as fh:
+                    with open(path_to_file, "rb") as source:
+                        shutil.copyfileobj(source, fh)
+                os.replace(fh.name, path)
+
+            self.entries.setdefault(project_slug, {}).setdefault(resource_slug, {})[
+                language_code
+            ] = {"revision": revision, "hash": digest}
+
+    def translations(self, project_slug: str) -> list[tuple[str, str]]:
+        """(resource_slug, language_code) of the translations of the project in store"""
+        return [
+            (resource_slug, language_code)
+            for resource_slug, languages in self.entries.get(project_slug, {}).items()
+            for language_code in languages
+        ]
+
+    @staticmethod
+    def restore(path_to_object: Path, path_to_file: str | Path) -> bool:
+        """
+        Put a copy of the stored file at the given path, replacing it atomically. Not a hard link: output files
+        may be edited in place (by editors, 'msgmerge'...), which must not alter the store.
+        Tells whether the file was written, as 'stream_to_file' does.
+        """
+        path = Path(path_to_file)
+        if Path.exists(path) and cmp(path_to_object, path, shallow=False):
+            return False
+
+        path_to_temp = path.with_name(f".{path.name}.{uuid4().hex}.part")
+        try:
+            shutil.copyfile(path_to_object, path_to_temp)
+            os.replace(path_to_temp, path)
+        finally:
+            path_to_temp.unlink(missing_ok=True)
+        return True
+
+    def prune(self) -> int:
+        """Remove the stored files no translation refers to anymore, such as those of past revisions; return how many"""
+        removed = 0
+        with self.lock:
+            referenced = {
+                entry["hash"]
+                for resources in self.entries.values()
+                for languages in resources.values()
+                for entry in languages.values()
+            }
+            for path in self.root.joinpath("objects").glob("*/*"):
+                # Temporary files being written start with a dot
+                if not (path.name in referenced or path.name.startswith(".")):
+                    path.unlink()
+                    removed += 1
+        return removed
+
+    def to_disk(self):
+        with self.lock:
+            super().to_disk()
+
+
+class Journal:
+    """
+    Append-only log of the progress of a pull or push: the async job submitted for each item, then the item's completion.
+    Written as it goes, one JSON event per line, so that an interrupted operation can be resumed: completed items are
+    skipped, and the jobs still in flight on the server are followed again instead of being submitted anew.
+    Unless 'resume' is set, any previous journal at 'path' is discarded.
+    """
+
+    def __init__(self, path: str | Path, resume: bool = False):
+        self.path = Path(path)
+        # Key -> id of the job submitted for the item, while it isn't completed
+        self.jobs: dict[str, str] = {}
+        # Key -> result recorded for the item
+        self.completed: dict[str, Any] = {}
+        self.lock = Lock()
+
+        if resume and Path.exists(self.path):
+            with open(self.path, "r") as fh:
+                for line in fh:
+                    try:
+                        self.replay(json.loads(line))
+                    except ValueError:
+                        # A last line cut short by the interruption
+                        continue
+
+        Path.mkdir(self.path.parent, parents=True, exist_ok=True)
+        self.fh = open(self.path, "a" if resume else "w")
+
+    def replay(self, event: dict[str, Any]):
+        key = event["key"]
+        if event["event"] == "submitted":
+            self.jobs[key] = event["job"]
+        elif event["event"] == "done":
+            self.jobs.pop(key, None)
+            self.completed[key] = event.get("result")
+        elif event["event"] == "failed":
+            self.jobs.pop(key, None)
+
+    def write(self, event: dict[str, Any]):
+        with self.lock:
+            self.replay(event)
+            self.fh.write(json.dumps(event) + "\n")
+            self.fh.flush()
+
+    def submitted(self, key: str, job_id: str):
+        self.write({"event": "submitted", "key": key, "job": job_id})
+
+    def done(self, key: str, result: Any = None):
+        self.write({"event": "done", "key": key, "result": result})
+
+    def failed(self, key: str):
+        """Forget the job of the item, so that it is submitted again on resumption"""
+        self.write({"event": "failed", "key": key})
+
+    def close(self, finished: bool):
+        """Close the journal, removing it once the operation finished without failures"""
+        self.fh.close()
+        if finished:
+            Path.unlink(self.path, missing_ok=True)
@@ -1,6 +1,19 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from filecmp import cmp
 from functools import wraps
-from typing import Any, Callable
+from pathlib import Path
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Hashable, Iterable
+from uuid import uuid4
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
 
 
 def ensure_login(f):
@@ -13,21 +26,223 @@ def ensure_login(f):
     return capture_args
 
 
+class ExpiringCache:
+    """
+    Thread-safe memo whose entries expire 'ttl' seconds after being computed (never if 'ttl' is None).
+    Concurrent lookups of the same missing key wait for a single computation.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, Lock] = {}
+        self._lock = Lock()
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            key_lock = self._locks.setdefault(key, Lock())
+
+        with key_lock:
+            if entry := self._entries.get(key):
+                created_at, value = entry
+                if self.ttl is None or monotonic() - created_at < self.ttl:
+                    return value
+
+            value = compute()
+            self._entries[key] = (monotonic(), value)
+            return value
+
+    def pop(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def default_max_workers() -> int:
+    """Size of the pools when none is configured, same as the default of 'ThreadPoolExecutor'"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def pooled_session(pool_size: int | None = None) -> requests.Session:
+    """
+    HTTP session keeping up to 'pool_size' connections alive per host, to be shared by the threads of a client,
+    and asking for compressed responses.
+    """
+    pool_size = pool_size or default_max_workers()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+def stream_to_file(
+    response: requests.Response, path_to_file: str | Path, chunk_size: int = 1 << 16
+) -> bool:
+    """
+    Stream the body of the response as bytes into a temporary file next to 'path_to_file',
+    then atomically rename it into place -- unless the file already holds that exact content,
+    in which case it's left untouched (and so is its mtime). Tells whether the file was written.
+    """
+    path = Path(path_to_file)
+    path_to_temp = path.with_name(f".{path.name}.{uuid4().hex}.part")
+
+    try:
+        with open(path_to_temp, "xb") as fh:
+            for chunk in response.iter_content(chunk_size):
+                fh.write(chunk)
+
+        if Path.exists(path) and cmp(path_to_temp, path, shallow=False):
+            path_to_temp.unlink()
+            return False
+
+        os.replace(path_to_temp, path)
+        return True
+
+    finally:
+        path_to_temp.unlink(missing_ok=True)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the threads of a client: allows 'rate' acquisitions per second on average,
+    with bursts of up to 'burst' acquisitions.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError(f"The rate of a RateLimiter must be positive, got: {rate}")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            sleep(wait)
+
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def retry_delay(error: Exception, attempt: int, backoff: float) -> float | None:
+    """
+    Seconds to wait before retrying after 'error', or None if it isn't worth retrying.
+    Rate-limited and unavailable responses are retried, honoring their 'Retry-After' header when present,
+    otherwise waiting an exponentially growing, jittered delay; so are connection errors and timeouts.
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return backoff * 2**attempt * uniform(0.5, 1.5)
+
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) not in RETRYABLE_STATUS_CODES:
+        return None
+
+    try:
+        return float(response.headers["Retry-After"])  # type: ignore
+    except (KeyError, TypeError, ValueError):
+        return backoff * 2**attempt * uniform(0.5, 1.5)
+
+
+def with_retries(
+    fn: Callable,
+    *,
+    rate_limiter: RateLimiter | None = None,
+    retries: int = 0,
+    backoff: float = 1.0,
+    on_retry: Callable[[], Any] | None = None,
+) -> Callable:
+    """
+    Wrap 'fn' so that each attempt waits for the rate limiter and retryable errors are retried,
+    calling 'on_retry' (if any) before each retry
+    """
+
+    @wraps(fn)
+    def attempt(*args, **kwargs):
+        for n in range(retries + 1):
+            if rate_limiter:
+                rate_limiter.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as error:
+                delay = retry_delay(error, n, backoff)
+                if delay is None or n == retries:
+                    raise
+                logger.warning(
+                    f"Retrying {getattr(fn, '__name__', fn)} in {delay:.1f}s (attempt {n + 1}/{retries}) after: {error}"
+                )
+                if on_retry:
+                    on_retry()
+                sleep(delay)
+
+    return attempt
+
+
 def concurrently(
     *,
     fn: Callable | None = None,
     args: list[Any] | None = None,
-    partials: list[Any] | None = None,
+    partials: Iterable[Any] | None = None,
+    max_workers: int | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retries: int = 0,
+    backoff: float = 1.0,
+    on_retry: Callable[[], Any] | None = None,
+    return_exceptions: bool = False,
 ) -> list[Any]:
-    with ThreadPoolExecutor() as pool:
+    """
+    Run the given tasks in a pool of at most 'max_workers' threads, and return their results
+    in the order the tasks were given.
+    Each task waits for 'rate_limiter' (if any) and is retried up to 'retries' times on retryable errors.
+    With 'return_exceptions', a failing task doesn't interrupt the others: its exception takes the place of its result.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
         if not partials is None:
             assert args is None and fn is None
-            futures = [pool.submit(p) for p in partials]
+            # Consumed as tasks are submitted, so that an iterator of tasks is run as it goes
+            tasks = ((p, ()) for p in partials)
         elif (not args is None) and (not fn is None):
             assert partials is None
-            futures = [pool.submit(fn, *a) for a in args]
+            tasks = [(fn, a) for a in args]
         else:
             raise ValueError(
                 "Exactly 1 of 'partials' or 'args' must be defined. Found neither was when calling concurrently."
             )
-        return [f.result() for f in as_completed(futures)]
+
+        futures = [
+            pool.submit(
+                with_retries(
+                    task,
+                    rate_limiter=rate_limiter,
+                    retries=retries,
+                    backoff=backoff,
+                    on_retry=on_retry,
+                ),
+                *a,
+            )
+            for task, a in tasks
+        ]
+
+        if return_exceptions:
+            wait(futures)
+            return [f.exception() or f.result() for f in futures]
+        return [f.result() for f in futures]
@@ -0,0 +1,21 @@
+"""Stand-ins for the asynchronous jobs of the API, to exercise their polling without any server"""
+
+
+class Job:
+    """Stands for an asynchronous job of the API, done (or failed) after the given number of reloads"""
+
+    def __init__(self, reloads: int, fail: bool = False):
+        self.id = f"job:{id(self)}"
+        self.reloads = reloads
+        self.fail = fail
+
+    def reload(self):
+        self.reloads -= 1
+
+
+def outcome(job: Job) -> tuple[bool, str | None]:
+    if job.reloads:
+        return False, None
+    if job.fail:
+        raise ValueError("Job failed")
+    return True, "done"
@@ -0,0 +1,515 @@
+"""
+Local stand-in for the parts of the Transifex API used by 'Client': projects, resources, languages,
+language statistics and the asynchronous source uploads and translation downloads.
+Responses are delayed by 'latency' seconds, and jobs only complete 'job_duration' seconds after being submitted.
+
+Transient failures can be injected with 'MockTransifex.fail'.
+
+Run it in-process through 'MockTransifex.start', or as its own process with 'python -m tests._mock_server',
+which prints the URL it listens on. 'GET /_stats' returns the number of requests received by endpoint.
+"""
+import argparse
+import json
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count, product
+from string import ascii_lowercase
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlparse
+
+from pytransifex.api import Client
+from pytransifex.async_api import AsyncClient
+from pytransifex.config import ApiConfig
+
+PAGE_SIZE = 150
+TRANSLATION = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"Language: {language_code}\\n"
+
+{messages}
+"""
+
+
+class MockTransifex(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        organization: str = "organization",
+        *,
+        latency: float = 0.0,
+        job_duration: float = 0.0,
+        strings: int = 10,
+        port: int = 0,
+    ):
+        super().__init__(("127.0.0.1", port), Handler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.organization = organization
+        self.latency = latency
+        self.job_duration = job_duration
+        self.strings = strings
+
+        self.lock = Lock()
+        self.stats: Counter = Counter()
+        # Requests being handled, and the most handled at once
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.ids = count(1)
+        # Codes of the languages of Transifex besides those of the projects, which make up the catalog listed
+        self.languages = {"de", "es", "fr", "it", "pt_BR"}
+        # Project id -> project data, resource slugs and language codes
+        self.projects: dict[str, dict[str, Any]] = {}
+        # Job id -> job type, time at which it completes and what it is about
+        self.jobs: dict[str, tuple[str, float, dict[str, Any]]] = {}
+        # Resource id -> source string id -> attributes
+        self.source_strings: dict[str, dict[str, dict[str, Any]]] = {}
+        # Endpoint (as in 'stats') -> statuses of its next responses, see 'fail'
+        self.failures: dict[str, list[int]] = {}
+
+    def start(self) -> "MockTransifex":
+        Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def add_project(
+        self,
+        slug: str,
+        resource_slugs: list[str],
+        language_codes: list[str],
+        untranslated: list[tuple[str, str]] | None = None,
+    ) -> str:
+        """Add a project whose translations are complete, except for the (resource, language) pairs 'untranslated'"""
+        project_id = f"o:{self.organization}:p:{slug}"
+        self.projects[project_id] = {
+            "slug": slug,
+            "resources": list(resource_slugs),
+            "languages": list(language_codes),
+            "untranslated": set(untranslated or []),
+        }
+        return project_id
+
+    def fail(self, endpoint: str, *statuses: int):
+        """Reply to the next requests to the endpoint, such as 'POST /resources', with these error statuses"""
+        with self.lock:
+            self.failures.setdefault(endpoint, []).extend(statuses)
+
+    def config(self, **settings) -> ApiConfig:
+        """Config of a client of the organization, polling every 0.02s unless told otherwise"""
+        return ApiConfig(
+            "token", self.organization, "PO", **{"poll_interval": 0.02, **settings}
+        )
+
+    def client(self, **settings) -> Client:
+        """Client of this server, with the given 'ApiConfig' settings"""
+        client = Client(self.config(**settings), defer_login=True)
+        client.host = self.url
+        return client
+
+    def async_client(self, **settings) -> AsyncClient:
+        """AsyncClient of this server, with the given 'ApiConfig' settings"""
+        tx = AsyncClient(self.config(**settings))
+        tx.client.host = self.url
+        return tx
+
+    # JSON:API documents
+
+    def project(self, project_id: str) -> dict[str, Any]:
+        slug = self.projects[project_id]["slug"]
+        return {
+            "type": "projects",
+            "id": project_id,
+            "attributes": {"slug": slug, "name": slug},
+            "relationships": {
+                "languages": {
+                    "links": {"related": f"{self.url}/projects/{project_id}/languages"}
+                },
+                "resources": {
+                    "links": {
+                        "related": f"{self.url}/resources?filter[project]={project_id}"
+                    }
+                },
+                "coordinators": {"links": {}},
+            },
+            "links": {"self": f"{self.url}/projects/{project_id}"},
+        }
+
+    def resource(self, project_id: str, slug: str) -> dict[str, Any]:
+        resource_id = f"{project_id}:r:{slug}"
+        return {
+            "type": "resources",
+            "id": resource_id,
+            "attributes": {
+                "slug": slug,
+                "name": slug,
+                "datetime_modified": now(),
+            },
+            "relationships": {
+                "project": {"data": {"type": "projects", "id": project_id}}
+            },
+            "links": {"self": f"{self.url}/resources/{resource_id}"},
+        }
+
+    @staticmethod
+    def language(code: str) -> dict[str, Any]:
+        return {
+            "type": "languages",
+            "id": f"l:{code}",
+            "attributes": {"code": code, "name": code},
+        }
+
+    def language_stats(
+        self, project_id: str, slug: str, language_code: str
+    ) -> dict[str, Any]:
+        untranslated = (slug, language_code) in self.projects[project_id][
+            "untranslated"
+        ]
+        return {
+            "type": "resource_language_stats",
+            "id": f"{project_id}:r:{slug}:l:{language_code}",
+            "attributes": {
+                "last_update": "2023-01-01T00:00:00Z",
+                "total_strings": self.strings,
+                "translated_strings": 0 if untranslated else self.strings,
+                "reviewed_strings": 0,
+                "proofread_strings": 0,
+            },
+        }
+
+    def source_string(self, resource_id: str, string_id: str) -> dict[str, Any]:
+        return {
+            "type": "resource_strings",
+            "id": string_id,
+            "attributes": self.source_strings[resource_id][string_id],
+            "relationships": {
+                "resource": {"data": {"type": "resources", "id": resource_id}}
+            },
+        }
+
+    def job(self, job_type: str, job_id: str) -> dict[str, Any]:
+        _, done_at, details = self.jobs[job_id]
+        done = monotonic() >= done_at
+        return {
+            "type": job_type,
+            "id": job_id,
+            "attributes": {
+                "status": "succeeded" if done else "pending",
+                "errors": [],
+                "details": details if done else {},
+            },
+            "links": {"self": f"{self.url}/{job_type}/{job_id}"},
+        }
+
+    def has_resource(self, resource_id: str) -> bool:
+        project_id, _, slug = resource_id.partition(":r:")
+        return slug in self.projects.get(project_id, {}).get("resources", [])
+
+    def submit_job(self, job_type: str, details: dict[str, Any]) -> dict[str, Any]:
+        job_id = str(next(self.ids))
+        self.jobs[job_id] = (job_type, monotonic() + self.job_duration, details)
+        return self.job(job_type, job_id)
+
+    def translation(self, job_id: str) -> str:
+        _, _, details = self.jobs[job_id]
+        messages = "\n".join(
+            f'msgid "{details["resource"]} {i}"\nmsgstr "{details["language"]} {i}"\n'
+            for i in range(self.strings)
+        )
+        return TRANSLATION.format(language_code=details["language"], messages=messages)
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: MockTransifex
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PATCH(self):
+        self.handle_request("PATCH")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+
+    def handle_request(self, method: str):
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.peak_in_flight = max(
+                self.server.peak_in_flight, self.server.in_flight
+            )
+        try:
+            self.route(method)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def route(self, method: str):
+        url = urlparse(self.path)
+        path = unquote(url.path).strip("/").split("/")
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        endpoint = f"{method} /{path[0]}"
+        with self.server.lock:
+            self.server.stats[endpoint] += 1
+            failures = self.server.failures.get(endpoint)
+            status = failures.pop(0) if failures else None
+        if path[0] != "_stats":
+            sleep(self.server.latency)
+
+        if status:
+            return self.reply(
+                status,
+                errors(str(status), "Injected failure"),
+                headers={"Retry-After": "0"},
+            )
+
+        try:
+            route = getattr(self, f"{method.lower()}_{path[0]}")
+        except AttributeError:
+            return self.reply(404, errors("404", f"Unknown endpoint: {self.path}"))
+
+        try:
+            route(path[1:], query, body)
+        except KeyError as error:
+            self.reply(404, errors("404", f"Not found: {error}"))
+
+    def reply(self, status: int, document: Any = None, headers: dict | None = None):
+        content = b"" if document is None else json.dumps(document).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if document is not None:
+            self.send_header("Content-Type", "application/vnd.api+json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def reply_page(self, items: list[dict[str, Any]], query: dict[str, str]):
+        cursor = int(query.pop("page[cursor]", 0))
+        links: dict[str, Any] = {"next": None}
+        if cursor + PAGE_SIZE < len(items):
+            params = "&".join(f"{k}={v}" for k, v in query.items())
+            links["next"] = (
+                f"{self.server.url}{urlparse(self.path).path}?{params}"
+                f"&page[cursor]={cursor + PAGE_SIZE}"
+            )
+        self.reply(200, {"data": items[cursor : cursor + PAGE_SIZE], "links": links})
+
+    # Endpoints, named after the method and the first segment of the path
+
+    def get__stats(self, path: list[str], query: dict[str, str], body: bytes):
+        self.reply(200, dict(self.server.stats))
+
+    def get_projects(self, path: list[str], query: dict[str, str], body: bytes):
+        project_id = path[0]
+        if path[1:] == ["languages"]:
+            codes = self.server.projects[project_id]["languages"]
+            self.reply_page([self.server.language(c) for c in codes], query)
+        elif path[1:] == ["relationships", "coordinators"]:
+            ids = self.server.projects[project_id].get("coordinators", [])
+            self.reply_page([{"type": "users", "id": i} for i in ids], query)
+        else:
+            self.reply(200, {"data": self.server.project(project_id)})
+
+    def post_projects(self, path: list[str], query: dict[str, str], body: bytes):
+        project_id, _, field = path
+        project = self.server.projects[project_id]
+        ids = [item["id"] for item in json.loads(body)["data"]]
+        if field == "languages":
+            project["languages"] += [i.removeprefix("l:") for i in ids]
+        else:
+            project.setdefault(field, []).extend(ids)
+        self.reply(204)
+
+    def get_resources(self, path: list[str], query: dict[str, str], body: bytes):
+        project_id = query["filter[project]"]
+        slugs = self.server.projects[project_id]["resources"]
+        self.reply_page([self.server.resource(project_id, s) for s in slugs], query)
+
+    def post_resources(self, path: list[str], query: dict[str, str], body: bytes):
+        data = json.loads(body)["data"]
+        project_id = data["relationships"]["project"]["data"]["id"]
+        slug = data["attributes"]["slug"]
+        if slug in self.server.projects[project_id]["resources"]:
+            return self.reply(409, errors("409", f"Resource already exists: {slug}"))
+        self.server.projects[project_id]["resources"].append(slug)
+        self.reply(201, {"data": self.server.resource(project_id, slug)})
+
+    def get_languages(self, path: list[str], query: dict[str, str], body: bytes):
+        if code := query.get("filter[code]"):
+            # Only the exact spelling of Transifex
+            known = self.server.languages.union(
+                *(p["languages"] for p in self.server.projects.values())
+            )
+            found = [self.server.language(code)] if code in known else []
+            self.reply(200, {"data": found, "links": {}})
+        else:
+            # The catalog: the languages of all the projects
+            codes = {c for p in self.server.projects.values() for c in p["languages"]}
+            self.reply_page([self.server.language(c) for c in sorted(codes)], query)
+
+    def get_resource_language_stats(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        project_id = query["filter[project]"]
+        project = self.server.projects[project_id]
+        codes = project["languages"]
+        if language := query.get("filter[language]"):
+            codes = [c for c in codes if f"l:{c}" == language]
+        stats = [
+            self.server.language_stats(project_id, slug, code)
+            for slug in project["resources"]
+            for code in codes
+        ]
+        self.reply_page(stats, query)
+
+    def get_resource_strings(self, path: list[str], query: dict[str, str], body: bytes):
+        resource_id = query["filter[resource]"]
+        strings = self.server.source_strings.get(resource_id, {})
+        self.reply_page(
+            [self.server.source_string(resource_id, s) for s in strings], query
+        )
+
+    def post_resource_strings(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        created = []
+        for item in json.loads(body)["data"]:
+            resource_id = item["relationships"]["resource"]["data"]["id"]
+            string_id = f"{resource_id}:s:{next(self.server.ids)}"
+            strings = self.server.source_strings.setdefault(resource_id, {})
+            strings[string_id] = item["attributes"]
+            created.append(self.server.source_string(resource_id, string_id))
+        self.reply(200, {"data": created})
+
+    def patch_resource_strings(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        updated = []
+        for item in json.loads(body)["data"]:
+            resource_id = item["id"].split(":s:")[0]
+            self.server.source_strings[resource_id][item["id"]].update(
+                item["attributes"]
+            )
+            updated.append(self.server.source_string(resource_id, item["id"]))
+        self.reply(200, {"data": updated})
+
+    def delete_resource_strings(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        for item in json.loads(body)["data"]:
+            resource_id = item["id"].split(":s:")[0]
+            del self.server.source_strings[resource_id][item["id"]]
+        self.reply(204)
+
+    def post_resource_translations_async_downloads(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        relationships = json.loads(body)["data"]["relationships"]
+        resource_id = relationships["resource"]["data"]["id"]
+        if not self.server.has_resource(resource_id):
+            return self.reply(404, errors("404", f"Not found: {resource_id}"))
+        details = {
+            "resource": resource_id.rsplit(":r:", 1)[-1],
+            "language": relationships["language"]["data"]["id"].split(":", 1)[-1],
+        }
+        job = self.server.submit_job("resource_translations_async_downloads", details)
+        self.reply(202, {"data": job})
+
+    def get_resource_translations_async_downloads(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        job = self.server.job("resource_translations_async_downloads", path[0])
+        if job["attributes"]["status"] == "succeeded":
+            location = f"{self.server.url}/_files/{path[0]}"
+            self.reply(303, headers={"Location": location})
+        else:
+            self.reply(200, {"data": job})
+
+    def get__files(self, path: list[str], query: dict[str, str], body: bytes):
+        content = self.server.translation(path[0]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/x-po")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def post_resource_strings_async_uploads(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        # Multipart form with the resource id and the file content
+        match = re.search(rb'name="resource"\r\n\r\n(.*?)\r\n', body)
+        if not match:
+            return self.reply(400, errors("400", "Missing resource"))
+        if not self.server.has_resource(match.group(1).decode()):
+            return self.reply(404, errors("404", f"Not found: {match.group(1)}"))
+
+        details = {
+            "strings_created": 0,
+            "strings_updated": body.count(b"msgid") - 1,
+            "strings_deleted": 0,
+            "strings_skipped": 0,
+        }
+        job = self.server.submit_job("resource_strings_async_uploads", details)
+        self.reply(202, {"data": job})
+
+    def get_resource_strings_async_uploads(
+        self, path: list[str], query: dict[str, str], body: bytes
+    ):
+        self.reply(
+            200, {"data": self.server.job("resource_strings_async_uploads", path[0])}
+        )
+
+
+def errors(status: str, detail: str) -> dict[str, Any]:
+    return {"errors": [{"status": status, "code": "error", "detail": detail}]}
+
+
+def language_codes(n: int) -> list[str]:
+    """'n' made up (but valid) language codes: 'aa', 'ab'..."""
+    return ["".join(letters) for letters in product(ascii_lowercase, repeat=2)][:n]
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--organization", default="organization")
+    parser.add_argument("--project", default="project")
+    parser.add_argument("--resources", type=int, default=10)
+    parser.add_argument("--languages", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--job-duration", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockTransifex(
+        args.organization,
+        latency=args.latency,
+        job_duration=args.job_duration,
+        port=args.port,
+    )
+    server.add_project(
+        args.project,
+        [f"resource_{i}" for i in range(args.resources)],
+        language_codes(args.languages),
+    )
+    print(server.url, flush=True)
+    server.serve_forever()
@@ -186,15 +186,19 @@ class Translation:
             f"{len(existing_langs)} languages found for resource :"
             f" ({existing_langs})"
         )
-        for lang in self.parameters.translation_languages:
-            if lang not in existing_langs:
-                logger.debug(f"Creating missing language: {lang}")
-                self.tx_client.create_language(
-                    project_slug=self.parameters.project_slug,
-                    language_code=lang,
-                    coordinators=[self.parameters.transifex_coordinator],
-                )
-                existing_langs.append(lang)
+        missing_langs = [
+            lang
+            for lang in self.parameters.translation_languages
+            if lang not in existing_langs
+        ]
+        if missing_langs:
+            logger.debug(f"Creating missing languages: {missing_langs}")
+            self.tx_client.create_languages(
+                project_slug=self.parameters.project_slug,
+                language_codes=missing_langs,
+                coordinators=[self.parameters.transifex_coordinator],
+            )
+            existing_langs += missing_langs
         for lang in existing_langs:
             ts_file = f"{self.parameters.plugin_path}/i18n/{self.parameters.transifex_resource}_{lang}.ts"
             logger.debug(f"Downloading translation file: {ts_file}")
@@ -0,0 +1,152 @@
+"""
+Throughput of 'Client.pull' and 'Client.push' against the local stand-in for Transifex ('tests._mock_server'),
+run in its own process so that only the client is measured.
+Reports, for each number of resources: the requests received by the server, the wall time and
+the peak memory allocated by Python while the operation ran.
+
+    python -m tests.benchmark --resources 10 100 1000 --languages 50
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+from urllib.request import urlopen
+
+from pytransifex.api import Client
+from pytransifex.config import ApiConfig
+from tests._mock_server import language_codes
+
+PATH_TO_SOURCE = Path(__file__).parent.joinpath(
+    "data", "resources", "test_resource_fr.po"
+)
+
+
+class Measure(NamedTuple):
+    operation: str
+    resources: int
+    languages: int
+    requests: int
+    seconds: float
+    peak_memory: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.operation:<5} {self.resources:>6} x {self.languages:<4}"
+            f"{self.requests:>10} requests {self.seconds:>9.2f} s"
+            f"{self.peak_memory / 2**20:>9.1f} MiB"
+        )
+
+
+class MockServerProcess:
+    """'tests._mock_server' run as a subprocess for the duration of a 'with' block"""
+
+    def __init__(self, *args: str):
+        self.args = args
+
+    def __enter__(self) -> "MockServerProcess":
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "tests._mock_server", *self.args],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert self.process.stdout
+        # Skipping what 'tests' logs on import, up to the URL printed by the server
+        for line in self.process.stdout:
+            if line.startswith("http://"):
+                self.url = line.strip()
+                break
+        return self
+
+    def __exit__(self, *_):
+        self.process.terminate()
+        self.process.wait()
+
+    def requests(self) -> int:
+        with urlopen(f"{self.url}/_stats") as response:
+            stats = json.load(response)
+        return sum(n for endpoint, n in stats.items() if endpoint != "GET /_stats")
+
+
+def measure(
+    operation: str,
+    resources: int,
+    languages: int,
+    server_args: list[str],
+    run: Callable[[Client], Any],
+    config: ApiConfig,
+) -> Measure:
+    with MockServerProcess(
+        "--resources", str(resources), "--languages", str(languages), *server_args
+    ) as server:
+        client = Client(config, defer_login=True)
+        client.host = server.url
+
+        tracemalloc.start()
+        start = perf_counter()
+        run(client)
+        seconds = perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return Measure(
+            operation, resources, languages, server.requests(), seconds, peak
+        )
+
+
+def benchmark(
+    resources: list[int], languages: int, server_args: list[str], config: ApiConfig
+) -> list[Measure]:
+    measures = []
+    for n in resources:
+        slugs = [f"resource_{i}" for i in range(n)]
+        codes = language_codes(languages)
+
+        with TemporaryDirectory() as tmp:
+            pull = lambda client: client.pull(
+                project_slug="project",
+                resource_slugs=slugs,
+                language_codes=codes,
+                path_to_output_dir=tmp,
+            )
+            measures.append(measure("pull", n, languages, server_args, pull, config))
+            print(measures[-1], flush=True)
+
+        with TemporaryDirectory() as tmp:
+            paths = [str(Path(tmp).joinpath(f"{slug}.po")) for slug in slugs]
+            for path in paths:
+                copyfile(PATH_TO_SOURCE, path)
+
+            push = lambda client: client.push(
+                project_slug="project", resource_slugs=slugs, path_to_files=paths
+            )
+            measures.append(measure("push", n, 1, server_args, push, config))
+            print(measures[-1], flush=True)
+
+    return measures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resources", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--languages", type=int, default=50)
+    parser.add_argument("--latency", default="0.0", help="Seconds per request")
+    parser.add_argument("--job-duration", default="1.0", help="Seconds per job")
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    config = ApiConfig(
+        "token",
+        "organization",
+        "PO",
+        max_workers=args.max_workers,
+        poll_interval=args.poll_interval,
+    )
+    server_args = ["--latency", args.latency, "--job-duration", args.job_duration]
+    benchmark(args.resources, args.languages, server_args, config)
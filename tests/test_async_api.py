@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+from pathlib import Path
+from shutil import rmtree
+
+from pytransifex.async_api import AsyncClient
+from pytransifex.config import ApiConfig
+from pytransifex.interfaces import Tx
+from tests._jobs import Job, outcome
+from tests._mock_server import MockTransifex
+
+
+class TestAsyncClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config = ApiConfig(
+            "token",
+            "organization",
+            "PO",
+            max_workers=2,
+            poll_interval=0.01,
+            max_poll_interval=0.02,
+        )
+        cls.tx = AsyncClient(config)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tx.close()
+
+    def test1_satisfies_abc(self):
+        assert isinstance(self.tx, Tx)
+
+    def test2_wait_for(self):
+        async def wait_for_all(jobs: list[Job]) -> list[str]:
+            return await asyncio.gather(*(self.tx.wait_for(j, outcome) for j in jobs))
+
+        # Far more jobs in flight than threads in the pool
+        jobs = [Job(reloads=3) for _ in range(500)]
+        res = asyncio.run(wait_for_all(jobs))
+        assert res == ["done"] * 500
+        assert all(job.reloads == 0 for job in jobs)
+
+        stats = self.tx.client.instrumentation.snapshot()
+        assert stats.calls["poll"] == 3 * 500
+        assert stats.calls["queue"] == 500
+
+    def test3_pull_and_push(self):
+        server = MockTransifex(job_duration=0.05).start()
+        server.add_project("project", ["resource_a", "resource_b"], ["fr", "de"])
+        output_dir = Path.cwd().joinpath("tests", "output_async")
+        path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+
+        async def pull_and_push(tx: AsyncClient):
+            stats = await tx.pull(
+                project_slug="project", path_to_output_dir=str(output_dir)
+            )
+            result = await tx.push(
+                project_slug="project",
+                resource_slugs=["resource_a", "resource_c"],
+                path_to_files=[str(path_to_file)] * 2,
+                path_to_manifest=str(output_dir.joinpath(".pytx_manifest.json")),
+            )
+            return stats, result
+
+        try:
+            tx = server.async_client(
+                path_to_store=str(output_dir.joinpath(".pytx_store"))
+            )
+            try:
+                stats, result = asyncio.run(pull_and_push(tx))
+            finally:
+                tx.close()
+
+            written = sorted(p.name for p in output_dir.iterdir() if p.is_file())
+            assert written == [
+                ".pytx_manifest.json",
+                "resource_a_de",
+                "resource_a_fr",
+                "resource_b_de",
+                "resource_b_fr",
+            ]
+            assert stats.calls["submit"] == stats.calls["download"] == 4
+            assert len(tx.client.store.translations("project")) == 4
+
+            assert [r.slug for r in result.with_status("updated")] == ["resource_a"]
+            assert [r.slug for r in result.with_status("created")] == ["resource_c"]
+        finally:
+            server.stop()
+            if Path.exists(output_dir):
+                rmtree(output_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pytransifex.jobs import JobCoordinator
+from tests._jobs import Job, outcome
+
+
+class TestJobCoordinator(unittest.TestCase):
+    def test1_run(self):
+        jobs = {i: Job(reloads=1 + i % 3, fail=i == 7) for i in range(100)}
+
+        with ThreadPoolExecutor(4) as pool:
+            coordinator = JobCoordinator(
+                pool, outcome, poll_interval=0.01, max_poll_interval=0.02
+            )
+            res = dict(coordinator.run(jobs))
+
+        assert sorted(res) == list(range(100))
+        assert isinstance(res.pop(7), ValueError)
+        assert set(res.values()) == {"done"}
+
+    def test2_polls_until_done(self):
+        job = Job(reloads=4)
+
+        with ThreadPoolExecutor(1) as pool:
+            coordinator = JobCoordinator(
+                pool, outcome, poll_interval=0.01, max_poll_interval=1
+            )
+            assert list(coordinator.run({"job": job})) == [("job", "done")]
+
+        assert job.reloads == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
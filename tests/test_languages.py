@@ -0,0 +1,183 @@
+import asyncio
+import unittest
+from pathlib import Path
+from shutil import rmtree
+
+from pytransifex.languages import LanguageRegistry, normalize_language_code, registry
+from tests._mock_server import MockTransifex
+
+
+class TestLanguages(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_dir = Path.cwd().joinpath("tests", "output_languages")
+        cls.path_to_cache = cls.output_dir.joinpath(".pytx_languages.json")
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_normalize(self):
+        for code in ["fr-FR", "fr_fr", "FR-fr"]:
+            assert normalize_language_code(code) == "fr_FR"
+        assert normalize_language_code("zh-hans") == "zh_Hans"
+        assert normalize_language_code("es_419") == "es_419"
+        assert normalize_language_code("sr@Latin") == "sr@latin"
+
+        for code in ["", "f", "french", "fr FR", "fr_"]:
+            with self.assertRaises(ValueError):
+                normalize_language_code(code)
+
+    def test2_registry_on_disk(self):
+        fetched = []
+
+        def fetch():
+            fetched.append(1)
+            return [{"type": "languages", "id": "l:fr", "attributes": {"code": "fr"}}]
+
+        assert (
+            LanguageRegistry().resolve("fr", fetch, self.path_to_cache)["id"] == "l:fr"
+        )
+        # Another process: read from disk
+        assert LanguageRegistry().resolve("de", fetch, self.path_to_cache) is None
+        assert len(fetched) == 1
+
+        # Expired
+        LanguageRegistry().resolve("fr", fetch, self.path_to_cache, ttl=0)
+        assert len(fetched) == 2
+
+    def test3_client_resolves_languages_locally(self):
+        server = MockTransifex().start()
+        server.add_project("project", ["resource"], ["fr", "fr_FR", "de"])
+        registry.clear()
+
+        try:
+            client = server.client()
+            client.login()
+
+            assert client.get_language("fr-fr").id == "l:fr_FR"
+            assert client.get_language("de").id == "l:de"
+            assert client.get_language("it").id == "l:it"
+            # The catalog, then the one language missing from it
+            assert server.stats["GET /languages"] == 2
+
+            with self.assertRaises(ValueError):
+                client.get_language("not a code")
+        finally:
+            server.stop()
+            registry.clear()
+
+    def test4_create_languages(self):
+        server = MockTransifex().start()
+        server.add_project("project", ["resource"], ["fr"])
+
+        try:
+            client = server.client()
+
+            codes = ["fr", "de", "it", "es", "pt_BR", "pt-br"]
+            added = client.create_languages(
+                project_slug="project",
+                language_codes=codes,
+                coordinators=["alice", "bob"],
+            )
+            assert added == ["de", "it", "es", "pt_BR"]
+            assert sorted(client.list_languages("project")) == sorted(["fr", *added])
+            # One request for the languages, one for the coordinators
+            assert server.stats["POST /projects"] == 2
+
+            # Only the coordinator missing
+            assert not client.create_languages(
+                project_slug="project", language_codes=["fr"], coordinators=["bob"]
+            )
+            assert server.stats["POST /projects"] == 2
+            client.create_languages(
+                project_slug="project",
+                language_codes=["fr"],
+                coordinators=["alice", "carol"],
+            )
+            assert client.list_coordinators("project") == ["alice", "bob", "carol"]
+        finally:
+            server.stop()
+            registry.clear()
+
+    def test5_pull_normalizes_codes(self):
+        server = MockTransifex().start()
+        server.add_project("project", ["resource"], ["fr_CH", "de"])
+        output_dir = self.output_dir.joinpath("pulled")
+
+        try:
+            client = server.client()
+            client.use_store(self.output_dir.joinpath(".pytx_store"))
+            pull = lambda **kwargs: client.pull(
+                project_slug="project",
+                language_codes=["fr-ch", "fr_CH"],
+                path_to_output_dir=str(output_dir),
+                path_to_state=str(self.output_dir.joinpath(".pytx_pull_state.json")),
+                **kwargs,
+            )
+
+            stats = pull()
+            assert [p.name for p in output_dir.iterdir()] == ["resource_fr_CH"]
+            assert stats.calls["submit"] == 1
+
+            # Found in the pull state and the store
+            stats = pull()
+            assert "submit" not in stats.calls
+            stats = pull(offline=True)
+            assert stats.counters["files_restored"] == 1
+        finally:
+            server.stop()
+            registry.clear()
+
+    def test6_transifex_spellings(self):
+        server = MockTransifex().start()
+        server.add_project("project", ["resource"], ["zh-Hans", "sr@Latn"])
+        output_dir = self.output_dir.joinpath("spelled")
+
+        try:
+            client = server.client()
+            client.use_store(self.output_dir.joinpath(".pytx_store_spelled"))
+            stats = client.pull(
+                project_slug="project",
+                language_codes=["zh_hans", "SR@latn"],
+                path_to_output_dir=str(output_dir),
+            )
+            assert stats.calls["submit"] == 2
+            assert sorted(p.name for p in output_dir.iterdir()) == [
+                "resource_sr@Latn",
+                "resource_zh-Hans",
+            ]
+
+            # Named as in a pull, whichever client
+            path = client.get_translation(
+                "project", "resource", "zh_hans", None, str(output_dir)
+            )
+            tx = server.async_client()
+            try:
+                path_async = asyncio.run(
+                    tx.get_translation(
+                        "project", "resource", "ZH-hans", None, str(output_dir)
+                    )
+                )
+            finally:
+                tx.close()
+            assert path == path_async == str(output_dir.joinpath("resource_zh-Hans"))
+
+            stats = client.pull(
+                project_slug="project",
+                language_codes=["zh_hans"],
+                path_to_output_dir=str(output_dir),
+                offline=True,
+            )
+            assert stats.counters["files_restored"] == 1
+            assert not client.create_languages(
+                project_slug="project", language_codes=["zh_hans", "sr@latn"]
+            )
+        finally:
+            server.stop()
+            registry.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
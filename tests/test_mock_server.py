@@ -0,0 +1,592 @@
+import asyncio
+import gettext
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from shutil import copyfile, rmtree
+from unittest.mock import patch
+
+from pytransifex.cli import extract_files, sync_projects
+from pytransifex.config import SyncProject
+from pytransifex.jobs import JobCoordinator
+from pytransifex.state import Journal
+from tests._mock_server import MockTransifex
+
+
+class TestMockServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTransifex(job_duration=0.05).start()
+        cls.resource_slugs = ["resource_a", "resource_b"]
+        cls.language_codes = ["fr", "de", "it"]
+        cls.server.add_project("project", cls.resource_slugs, cls.language_codes)
+
+        cls.path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+        cls.output_dir = Path.cwd().joinpath("tests", "output_mock")
+
+        cls.client = cls.server.client()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_pull(self):
+        stats = self.client.pull(
+            project_slug="project",
+            resource_slugs=self.resource_slugs,
+            language_codes=self.language_codes,
+            path_to_output_dir=str(self.output_dir),
+        )
+        written = sorted(p.name for p in self.output_dir.iterdir())
+        assert written == sorted(
+            f"{slug}_{code}"
+            for slug in self.resource_slugs
+            for code in self.language_codes
+        )
+        assert self.server.stats["POST /resource_translations_async_downloads"] == 6
+
+        # Every request made by the client is accounted for
+        assert stats.counters["requests"] == sum(self.server.stats.values())
+        assert stats.calls["submit"] == stats.calls["download"] == 6
+        assert stats.counters["bytes_downloaded"] == sum(
+            p.stat().st_size for p in self.output_dir.iterdir()
+        )
+
+    def test2_push(self):
+        result = self.client.push(
+            project_slug="project",
+            resource_slugs=["resource_a", "resource_c"],
+            path_to_files=[str(self.path_to_file)] * 2,
+        )
+        assert [r.slug for r in result.with_status("updated")] == ["resource_a"]
+        assert [r.slug for r in result.with_status("created")] == ["resource_c"]
+        assert not result.failed
+        assert result.stats.calls["submit"] == 2
+        assert result.stats.counters["bytes_uploaded"] == 2 * len(
+            self.path_to_file.read_bytes()
+        )
+
+    def test3_hooks(self):
+        spans = []
+
+        @contextmanager
+        def hook(name: str, attributes: dict):
+            spans.append((name, attributes))
+            yield
+
+        self.client.instrumentation.add_hook(hook)
+        self.client.get_translation(
+            "project", "resource_a", "fr", path_to_output_dir=str(self.output_dir)
+        )
+        self.client.instrumentation.hooks.remove(hook)
+
+        phases = [name for name, _ in spans]
+        assert phases.count("submit") == phases.count("download") == 1
+        assert "poll" in phases
+        assert (
+            dict(spans)["submit"]["resource"] == "o:organization:p:project:r:resource_a"
+        )
+
+    def test4_pull_discovers_translations(self):
+        self.server.add_project(
+            "discovered",
+            ["resource_a", "resource_b"],
+            ["fr", "de"],
+            untranslated=[("resource_b", "de")],
+        )
+        output_dir = self.output_dir.joinpath("discovered")
+        self.client.pull(project_slug="discovered", path_to_output_dir=str(output_dir))
+
+        written = sorted(p.name for p in output_dir.iterdir())
+        assert written == ["resource_a_de", "resource_a_fr", "resource_b_fr"]
+
+    def test5_sync(self):
+        for slug in ["plugin_a", "plugin_b"]:
+            self.server.add_project(slug, ["test_resource_fr"], ["fr", "de"])
+
+        path_to_manifest = self.output_dir.joinpath("sync", ".pytx_sync.toml")
+        path_to_manifest.parent.mkdir(parents=True, exist_ok=True)
+        path_to_manifest.write_text(
+            "".join(
+                f"""
+[[projects]]
+project_slug = "{slug}"
+input_directory = "{self.path_to_file.parent}"
+output_directory = "{slug}"
+language_codes = ["fr"]
+"""
+                for slug in ["plugin_a", "plugin_b"]
+            )
+        )
+        projects = SyncProject.from_manifest(path_to_manifest)
+        reports, stats = sync_projects(
+            self.client, projects, path_to_manifest.parent, max_projects=2
+        )
+
+        assert not [r for r in reports.values() if isinstance(r, Exception)]
+        for slug in ["plugin_a", "plugin_b"]:
+            written = path_to_manifest.parent.joinpath(slug, "test_resource_fr_fr")
+            assert Path.exists(written)
+        assert stats.calls["download"] == 2
+
+    def test6_delta_push(self):
+        resource_id = "o:organization:p:project:r:resource_a"
+        result = self.client.push(
+            project_slug="project",
+            resource_slugs=["resource_a"],
+            path_to_files=[str(self.path_to_file)],
+            delta=True,
+        )
+        assert result.resources[0].strings_created == 4
+        assert len(self.server.source_strings[resource_id]) == 4
+
+        # One string edited (hence a new key), one plural form changed
+        path_to_edited = self.output_dir.joinpath("edited.po")
+        path_to_edited.write_text(
+            self.path_to_file.read_text()
+            .replace("Let’s make the web multilingual.", "Let’s go multilingual.")
+            .replace("%d pages read.", "%d pages were read.")
+        )
+        uploads = self.server.stats["POST /resource_strings_async_uploads"]
+        result = self.client.push(
+            project_slug="project",
+            resource_slugs=["resource_a"],
+            path_to_files=[str(path_to_edited)],
+            delta=True,
+        )
+        pushed = result.resources[0]
+        assert (pushed.strings_created, pushed.strings_updated) == (1, 1)
+        assert pushed.strings_deleted == 1
+        assert self.server.stats["POST /resource_strings_async_uploads"] == uploads
+        assert (
+            sorted(
+                s["strings"]["other"]
+                for s in self.server.source_strings[resource_id].values()
+            )[0]
+            == "%d pages were read."
+        )
+
+    def test7_pull_by_language(self):
+        self.server.add_project(
+            "by_language",
+            [f"resource_{i}" for i in range(4)],
+            ["fr", "de", "it"],
+            untranslated=[(f"resource_{i}", "it") for i in range(4)],
+        )
+        output_dir = self.output_dir.joinpath("by_language")
+        path_to_state = self.output_dir.joinpath(".pytx_pull_state.json")
+        pull = lambda: self.client.pull(
+            project_slug="by_language",
+            language_codes=["fr", "it"],
+            path_to_output_dir=str(output_dir),
+            path_to_state=str(path_to_state),
+            by_language=True,
+        )
+
+        stats = pull()
+        written = sorted(p.name for p in output_dir.iterdir())
+        assert written == [f"resource_{i}_fr" for i in range(4)]
+        assert stats.calls["submit"] == 4
+
+        # Unchanged since: one request per language, and no job
+        stats = pull()
+        assert stats.calls["metadata"] == 2
+        assert "submit" not in stats.calls
+
+    def test8_resume_pull(self):
+        slugs = [f"resource_{i}" for i in range(3)]
+        self.server.add_project("resumed", slugs, ["fr"])
+        output_dir = self.output_dir.joinpath("resumed")
+        path_to_journal = self.output_dir.joinpath(".pytx_pull_journal.jsonl")
+        key = lambda slug: "resumed:" + self.client.prepare_output_file(
+            slug, "fr", None, str(output_dir)
+        )
+
+        # Interrupted with one translation downloaded and one job still in flight
+        journal = Journal(path_to_journal)
+        self.client.get_translation(
+            project_slug="resumed",
+            resource_slug="resource_0",
+            language_code="fr",
+            path_to_output_dir=str(output_dir),
+        )
+        journal.done(key("resource_0"))
+        resource = self.client.get_resource_index("resumed")["resource_1"]
+        job = self.client.submit_download(resource, self.client.get_language("fr"))
+        journal.submitted(key("resource_1"), job.id)
+        journal.close(finished=False)
+
+        stats = self.client.pull(
+            project_slug="resumed",
+            resource_slugs=slugs,
+            language_codes=["fr"],
+            path_to_output_dir=str(output_dir),
+            path_to_journal=str(path_to_journal),
+            resume=True,
+        )
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            f"{slug}_fr" for slug in slugs
+        ]
+        assert stats.calls["submit"] == 1
+        assert stats.calls["download"] == 2
+        # Done without failures
+        assert not Path.exists(path_to_journal)
+
+    def test9_translation_store(self):
+        slugs = ["resource_a", "resource_b"]
+        self.server.add_project("stored", slugs, ["fr", "de"])
+        self.client.use_store(self.output_dir.joinpath(".pytx_store"))
+        pull = lambda output_dir, **kwargs: self.client.pull(
+            project_slug="stored",
+            path_to_output_dir=str(self.output_dir.joinpath(output_dir)),
+            **kwargs,
+        )
+
+        try:
+            stats = pull("first")
+            assert stats.calls["submit"] == 4
+
+            # Same revisions: taken from the store, into a fresh output directory
+            stats = pull("second")
+            assert "submit" not in stats.calls
+            assert stats.counters["files_restored"] == 4
+
+            # Forced: downloaded anyway, even over a file edited since
+            edited = self.output_dir.joinpath("second", "resource_a_fr")
+            edited.write_text("edited")
+            stats = pull("second", force=True)
+            assert stats.calls["submit"] == 4
+            assert "files_restored" not in stats.counters
+            assert edited.read_text() != "edited"
+
+            stats = pull("offline", offline=True, language_codes=["fr"])
+            assert "requests" not in stats.counters
+            for slug in slugs:
+                first = self.output_dir.joinpath("first", f"{slug}_fr")
+                offline = self.output_dir.joinpath("offline", f"{slug}_fr")
+                assert first.read_bytes() == offline.read_bytes()
+            assert len(list(self.output_dir.joinpath("offline").iterdir())) == 2
+        finally:
+            self.client.store = None
+
+
+coordinator_run = JobCoordinator.run
+
+
+def interrupted_run(coordinator: JobCoordinator, jobs):
+    """'JobCoordinator.run' killed while following the last of 3 jobs, the first two being done"""
+    for n, done in enumerate(coordinator_run(coordinator, jobs)):
+        if n == 2:
+            raise KeyboardInterrupt
+        yield done
+
+
+class TestInterruptedPull(unittest.TestCase):
+    def test1_resume_interrupted_polling(self):
+        server = MockTransifex(job_duration=0.05).start()
+        slugs = [f"resource_{i}" for i in range(3)]
+        server.add_project("interrupted", slugs, ["fr"])
+        output_dir = Path.cwd().joinpath("tests", "output_interrupted")
+        path_to_journal = output_dir.joinpath(".pytx_pull_journal.jsonl")
+
+        client = server.client()
+        pull = lambda: client.pull(
+            project_slug="interrupted",
+            resource_slugs=slugs,
+            language_codes=["fr"],
+            path_to_output_dir=str(output_dir),
+            path_to_journal=str(path_to_journal),
+            resume=True,
+        )
+
+        try:
+            with patch.object(JobCoordinator, "run", interrupted_run):
+                with self.assertRaises(KeyboardInterrupt):
+                    pull()
+
+            stats = pull()
+            assert sorted(p.name for p in output_dir.iterdir() if p.is_file()) == [
+                f"{slug}_fr" for slug in slugs
+            ]
+            # The job of the last translation followed again, its file only downloaded
+            assert "submit" not in stats.calls
+            assert stats.calls["download"] == 1
+        finally:
+            server.stop()
+            if Path.exists(output_dir):
+                rmtree(output_dir)
+
+    def test2_resume_expired_job(self):
+        server = MockTransifex(job_duration=0.05).start()
+        slugs = [f"resource_{i}" for i in range(3)]
+        server.add_project("expired", slugs, ["fr"])
+        output_dir = Path.cwd().joinpath("tests", "output_expired")
+        path_to_journal = output_dir.joinpath(".pytx_pull_journal.jsonl")
+
+        client = server.client()
+        pull = lambda: client.pull(
+            project_slug="expired",
+            resource_slugs=slugs,
+            language_codes=["fr"],
+            path_to_output_dir=str(output_dir),
+            path_to_journal=str(path_to_journal),
+            resume=True,
+        )
+
+        try:
+            with patch.object(JobCoordinator, "run", interrupted_run):
+                with self.assertRaises(KeyboardInterrupt):
+                    pull()
+            # Forgotten by the server in the meantime, hence not found when followed again
+            server.jobs.clear()
+
+            stats = pull()
+            assert sorted(p.name for p in output_dir.iterdir() if p.is_file()) == [
+                f"{slug}_fr" for slug in slugs
+            ]
+            # Submitted anew in the same run, rather than left for the next one
+            assert stats.calls["submit"] == 1
+            assert stats.calls["download"] == 1
+            assert not path_to_journal.exists()
+        finally:
+            server.stop()
+            if Path.exists(output_dir):
+                rmtree(output_dir)
+
+
+class TestPushFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTransifex(job_duration=0.05).start()
+        cls.server.add_project("scanned", [], ["fr"])
+        cls.output_dir = Path.cwd().joinpath("tests", "output_scan")
+        cls.input_dir = cls.output_dir.joinpath("input")
+
+        path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+        for name in ["a/one.po", "a/b/two.po", "build/three.po", "a/notes.txt"]:
+            path = cls.input_dir.joinpath(name)
+            Path.mkdir(path.parent, parents=True, exist_ok=True)
+            copyfile(path_to_file, path)
+
+        cls.client = cls.server.client()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_extract_files(self):
+        files = extract_files(self.input_dir, ["*.po"], ["build"], "{path}")
+        assert sorted(slug for slug, _ in files) == ["a_b_two", "a_one"]
+
+        with self.assertRaises(ValueError):
+            list(extract_files(self.input_dir, slug_template="{parent}"))
+
+    def test2_push_files(self):
+        path_to_manifest = self.output_dir.joinpath(".pytx_manifest.json")
+        push = lambda: self.client.push_files(
+            project_slug="scanned",
+            files=extract_files(self.input_dir, ["*.po"], ["build"], "{path}"),
+            path_to_manifest=str(path_to_manifest),
+        )
+
+        result = push()
+        assert sorted(r.slug for r in result.with_status("created")) == [
+            "a_b_two",
+            "a_one",
+        ]
+        assert result.stats.calls["submit"] == 2
+
+        # Left untouched since: skipped on their size and modification time
+        result = push()
+        assert len(result.with_status("skipped")) == 2
+        assert "submit" not in result.stats.calls
+
+    def test3_retried_upload(self):
+        path_to_file = next(self.input_dir.joinpath("a").glob("*.po"))
+        created = self.server.stats["POST /resources"]
+        self.server.fail("POST /resource_strings_async_uploads", 503)
+
+        result = self.client.push(
+            project_slug="scanned",
+            resource_slugs=["retried"],
+            path_to_files=[str(path_to_file)],
+        )
+        assert [r.slug for r in result.with_status("created")] == ["retried"]
+        assert result.stats.counters["retries"] == 1
+        # Created once, not again when retrying the upload
+        assert self.server.stats["POST /resources"] == created + 1
+
+
+class TestSyncLimits(unittest.TestCase):
+    def test1_requests_in_flight(self):
+        server = MockTransifex(latency=0.02, job_duration=0.05).start()
+        slugs = [f"plugin_{i}" for i in range(4)]
+        for slug in slugs:
+            server.add_project(slug, [f"resource_{i}" for i in range(4)], ["fr", "de"])
+        output_dir = Path.cwd().joinpath("tests", "output_limits")
+
+        try:
+            client = server.client()
+            client.limit(max_workers=3)
+
+            projects = [
+                SyncProject(slug, output_directory=output_dir.joinpath(slug))
+                for slug in slugs
+            ]
+            reports, stats = sync_projects(
+                client, projects, output_dir, push=False, max_projects=4
+            )
+            assert not [r for r in reports.values() if isinstance(r, Exception)]
+            assert stats.calls["download"] == 4 * 4 * 2
+            # Not 3 per pool of each of the 4 projects
+            assert server.peak_in_flight <= 3
+        finally:
+            server.stop()
+            if Path.exists(output_dir):
+                rmtree(output_dir)
+
+    def test2_requests_per_second(self):
+        server = MockTransifex(job_duration=0.05).start()
+        server.add_project("plugin", ["resource_a", "resource_b"], ["fr", "de"])
+        output_dir = Path.cwd().joinpath("tests", "output_limits")
+
+        try:
+            client = server.client()
+            client.limit(max_workers=3, requests_per_second=1000)
+            limiter = client.rate_limiter
+            with patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+                reports, _ = sync_projects(
+                    client,
+                    [SyncProject("plugin", output_directory=output_dir)],
+                    output_dir,
+                    push=False,
+                )
+            assert not [r for r in reports.values() if isinstance(r, Exception)]
+            # Metadata lookups, submissions, polls and downloads alike, once each
+            assert acquire.call_count == sum(server.stats.values())
+        finally:
+            server.stop()
+            if Path.exists(output_dir):
+                rmtree(output_dir)
+
+
+class TestStaleMetadata(unittest.TestCase):
+    """Metadata cached by a client, then changed on Transifex by another one"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTransifex(job_duration=0.05).start()
+        cls.project_id = cls.server.add_project(
+            "changed", ["resource_a", "resource_b"], ["fr"]
+        )
+        cls.output_dir = Path.cwd().joinpath("tests", "output_stale")
+        cls.path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+
+        cls.path_to_metadata_cache = str(cls.output_dir.joinpath(".pytx_metadata.json"))
+        cls.client = cls.server.client(
+            path_to_metadata_cache=cls.path_to_metadata_cache
+        )
+        cls.client.get_resource_index("changed")
+        cls.client.list_languages("changed")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_push(self):
+        resources = self.server.projects[self.project_id]["resources"]
+        resources.remove("resource_a")
+        resources.append("resource_c")
+
+        result = self.client.push(
+            project_slug="changed",
+            resource_slugs=["resource_a", "resource_c"],
+            path_to_files=[str(self.path_to_file)] * 2,
+        )
+        assert not result.failed
+        # Deleted since, hence created again; created since, hence updated
+        assert [r.slug for r in result.with_status("created")] == ["resource_a"]
+        assert [r.slug for r in result.with_status("updated")] == ["resource_c"]
+
+    def test2_pull_discovers_languages(self):
+        self.server.projects[self.project_id]["languages"].append("de")
+        output_dir = self.output_dir.joinpath("pulled")
+        self.client.pull(project_slug="changed", path_to_output_dir=str(output_dir))
+
+        written = {p.name for p in output_dir.iterdir()}
+        assert {"resource_c_fr", "resource_c_de"} <= written
+
+    def test3_async_push(self):
+        resources = self.server.projects[self.project_id]["resources"]
+        resources.remove("resource_b")
+        resources.append("resource_d")
+
+        tx = self.server.async_client(
+            path_to_metadata_cache=self.path_to_metadata_cache
+        )
+        # Metadata as cached on disk by the other client
+        assert "resource_b" in tx.client.get_resource_index("changed")
+        try:
+            result = asyncio.run(
+                tx.push(
+                    project_slug="changed",
+                    resource_slugs=["resource_b", "resource_d"],
+                    path_to_files=[str(self.path_to_file)] * 2,
+                )
+            )
+        finally:
+            tx.close()
+        assert not result.failed
+        assert [r.slug for r in result.with_status("created")] == ["resource_b"]
+        assert [r.slug for r in result.with_status("updated")] == ["resource_d"]
+
+
+class TestCompileCatalogs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTransifex(job_duration=0.05).start()
+        cls.server.add_project("compiled", ["resource_a", "resource_b"], ["fr"])
+        cls.output_dir = Path.cwd().joinpath("tests", "output_compiled")
+
+        cls.client = cls.server.client()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_compile_catalogs(self):
+        pull = lambda: self.client.pull(
+            project_slug="compiled",
+            path_to_output_dir=str(self.output_dir),
+            compile_catalogs=True,
+        )
+
+        stats = pull()
+        assert stats.counters["files_compiled"] == 2
+        for slug in ["resource_a", "resource_b"]:
+            with open(self.output_dir.joinpath(f"{slug}_fr.mo"), "rb") as fh:
+                catalog = gettext.GNUTranslations(fh)
+            assert catalog.info()["language"] == "fr"
+
+        # Same content downloaded again: nothing to compile
+        stats = pull()
+        assert stats.calls["download"] == 2
+        assert "files_compiled" not in stats.counters
+
+
+if __name__ == "__main__":
+    unittest.main()
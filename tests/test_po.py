@@ -0,0 +1,75 @@
+import gettext
+import unittest
+from pathlib import Path
+from shutil import rmtree
+
+from pytransifex.po import compile_mo, parse_po, read_po
+
+
+class TestPo(unittest.TestCase):
+    def test1_read(self):
+        entries = read_po(
+            Path.cwd().joinpath("tests", "data", "resources", "test_resource_fr.po")
+        )
+        header, *messages = entries
+
+        assert header.is_header and "Plural-Forms" in header.msgstr[0]
+        assert len(messages) == 4
+        assert messages[1].msgid.endswith(
+            "globe on Lingohub for a fantastic localization experience."
+        )
+        assert messages[3].source_strings() == {
+            "one": "%d page read.",
+            "other": "%d pages read.",
+        }
+        assert messages[3].msgstr[1] == "%d Seiten gelesen wurden."
+
+    def test2_parse(self):
+        lines = [
+            "#. Shown on the menu",
+            "#: main.py:12 main.py:42",
+            "#, fuzzy, python-format",
+            'msgctxt "menu"',
+            'msgid "Open \\"%s\\"\\n"',
+            'msgstr "Ouvrir \\"%s\\"\\n"',
+            "",
+            '#~ msgid "Obsolete"',
+            '#~ msgstr "Obsolète"',
+            'msgid "Close"',
+            'msgstr ""',
+        ]
+        first, second = parse_po(iter(lines))
+
+        assert (first.msgctxt, first.msgid) == ("menu", 'Open "%s"\n')
+        assert first.fuzzy and "python-format" in first.flags
+        assert first.comments == ["Shown on the menu"]
+        assert first.occurrences == ["main.py:12", "main.py:42"]
+        assert (second.msgid, second.msgstr) == ("Close", {0: ""})
+
+    def test3_compile(self):
+        path_to_output = Path.cwd().joinpath("tests", "output_po", "catalog.mo")
+        Path.mkdir(path_to_output.parent, parents=True, exist_ok=True)
+        try:
+            compile_mo(
+                Path.cwd().joinpath(
+                    "tests", "data", "resources", "test_resource_fr.po"
+                ),
+                path_to_output,
+            )
+            with open(path_to_output, "rb") as fh:
+                catalog = gettext.GNUTranslations(fh)
+        finally:
+            rmtree(path_to_output.parent)
+
+        assert (
+            catalog.gettext("Let’s make the web multilingual.")
+            == "Machen wir das Internet mehrsprachig."
+        )
+        assert (
+            catalog.ngettext("%d page read.", "%d pages read.", 2)
+            == "%d Seiten gelesen wurden."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from pytransifex.results import PushedResource, PushResult
+
+
+class TestPushResult(unittest.TestCase):
+    def test1_from_upload(self):
+        details = {"strings_created": 3, "strings_updated": 2, "strings_deleted": 1}
+
+        created = PushedResource.from_upload("a", True, details)
+        assert created.status == "created" and created.strings_created == 3
+
+        updated = PushedResource.from_upload("b", False, details)
+        assert updated.status == "updated" and updated.strings_deleted == 1
+
+        failed = PushedResource.from_upload("c", False, ValueError("Parse error"))
+        assert failed.status == "failed" and isinstance(failed.error, ValueError)
+
+    def test2_summary(self):
+        result = PushResult(
+            "project",
+            [
+                PushedResource("a", "created", strings_created=3),
+                PushedResource("b", "updated", strings_updated=2),
+                PushedResource("c", "skipped"),
+                PushedResource("d", "failed", error=ValueError()),
+            ],
+        )
+        assert [r.slug for r in result.failed] == ["d"]
+        assert str(result) == (
+            "Pushed to project: 1 created, 1 updated, 1 skipped, 1 failed resource(s); "
+            "strings 3 created, 2 updated, 0 deleted."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
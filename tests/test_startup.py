@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import unittest
+from time import perf_counter
+
+# Seconds 'pytx --help' may take, interpreter startup included
+STARTUP_BUDGET = 1.5
+HEAVY_MODULES = ["transifex", "requests", "toml", "dotenv"]
+
+
+class TestStartup(unittest.TestCase):
+    def run_cli(self, code: str) -> tuple[float, str]:
+        start = perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            # Without credentials: showing the help must not need them
+            env={
+                k: v
+                for k, v in os.environ.items()
+                if not k in ["TX_TOKEN", "ORGANIZATION"]
+            },
+        )
+        return perf_counter() - start, result.stdout
+
+    def test1_help_skips_heavy_imports(self):
+        _, output = self.run_cli(
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from pytransifex.cli import cli\n"
+            "assert CliRunner().invoke(cli, ['--help']).exit_code == 0\n"
+            "print(','.join(sorted({m.split('.')[0] for m in sys.modules})))"
+        )
+        loaded = output.strip().split(",")
+        assert not [m for m in HEAVY_MODULES if m in loaded]
+
+    def test2_help_within_budget(self):
+        elapsed, output = self.run_cli(
+            "import sys\n"
+            "from pytransifex.cli import cli\n"
+            "sys.argv = ['pytx', '--help']\n"
+            "cli()"
+        )
+        assert "Usage" in output
+        assert elapsed < STARTUP_BUDGET, f"'pytx --help' took {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import unittest
+from pathlib import Path
+from shutil import rmtree
+
+from pytransifex.api import Client
+from pytransifex.config import ApiConfig
+from pytransifex.state import (
+    MetadataCache,
+    PullState,
+    PushManifest,
+    TranslationStore,
+    file_digest,
+)
+
+
+class TestPushManifest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+        cls.output_dir = Path.cwd().joinpath("tests", "output_state")
+        cls.path_to_manifest = cls.output_dir.joinpath(".pytx_manifest.json")
+        cls.digest = file_digest(cls.path_to_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_roundtrip(self):
+        manifest = PushManifest(self.path_to_manifest)
+        assert not manifest.is_unchanged("project", "resource", self.digest)
+
+        manifest.record("project", "resource", self.digest)
+        manifest.to_disk()
+
+        reloaded = PushManifest(self.path_to_manifest)
+        assert reloaded.is_unchanged("project", "resource", self.digest)
+        assert not reloaded.is_unchanged("project", "resource", "other")
+        assert not reloaded.is_unchanged("other_project", "resource", self.digest)
+
+    def test2_unchanged_push_is_offline(self):
+        manifest = PushManifest(self.path_to_manifest)
+        manifest.record("project", "resource", self.digest)
+        manifest.to_disk()
+
+        client = Client(ApiConfig("token", "organization", "PO"), defer_login=True)
+
+        def fail_login():
+            raise AssertionError("An unchanged push must not log in")
+
+        client.login = fail_login
+        result = client.push(
+            project_slug="project",
+            resource_slugs=["resource"],
+            path_to_files=[str(self.path_to_file)],
+            path_to_manifest=str(self.path_to_manifest),
+        )
+        assert [r.slug for r in result.with_status("skipped")] == ["resource"]
+
+    def test3_only_missing_resources_are_created(self):
+        client = Client(ApiConfig("token", "organization", "PO"), defer_login=True)
+        client.logged_in = True
+        client.get_resource_index = lambda project_slug: {"existing": object()}
+
+        def upload_sources(project_slug, resource_zipped_with_path, missing, **_):
+            return [
+                (slug, slug in missing, {"strings_created": 1})
+                for slug, _ in resource_zipped_with_path
+            ]
+
+        client.upload_sources = upload_sources
+        result = client.push(
+            project_slug="project",
+            resource_slugs=["existing", "new"],
+            path_to_files=[str(self.path_to_file)] * 2,
+        )
+        assert [r.slug for r in result.with_status("updated")] == ["existing"]
+        assert [r.slug for r in result.with_status("created")] == ["new"]
+
+
+class TestPullState(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_dir = Path.cwd().joinpath("tests", "output_state")
+        cls.path_to_state = cls.output_dir.joinpath(".pytx_pull_state.json")
+        cls.stats = {
+            "last_update": "2023-01-01T00:00:00Z",
+            "total_strings": 10,
+            "translated_strings": 5,
+            "reviewed_strings": 0,
+            "proofread_strings": 0,
+            "untranslated_words": 42,
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_roundtrip(self):
+        state = PullState(self.path_to_state)
+        assert not state.is_unchanged("project", "resource", "fr", self.stats)
+
+        state.record("project", "resource", "fr", self.stats)
+        state.to_disk()
+
+        reloaded = PullState(self.path_to_state)
+        assert reloaded.is_unchanged("project", "resource", "fr", self.stats)
+        assert not reloaded.is_unchanged("project", "resource", "de", self.stats)
+
+    def test2_changed_stats(self):
+        state = PullState(self.path_to_state)
+        state.record("project", "resource", "fr", self.stats)
+
+        untracked = {**self.stats, "untranslated_words": 0}
+        assert state.is_unchanged("project", "resource", "fr", untracked)
+
+        translated = {**self.stats, "translated_strings": 6}
+        assert not state.is_unchanged("project", "resource", "fr", translated)
+
+
+class TestMetadataCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_dir = Path.cwd().joinpath("tests", "output_state")
+        cls.path_to_cache = cls.output_dir.joinpath(".pytx_metadata.json")
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_roundtrip(self):
+        cache = MetadataCache(self.path_to_cache)
+        cache.set("key", ["fr", "de"])
+
+        assert MetadataCache(self.path_to_cache).get("key") == ["fr", "de"]
+        assert MetadataCache(self.path_to_cache, ttl=0).get("key") is None
+
+        cache.pop("key")
+        assert MetadataCache(self.path_to_cache).get("key") is None
+
+    def test2_client_reads_metadata_from_disk(self):
+        config = ApiConfig(
+            "token",
+            "organization",
+            "PO",
+            path_to_metadata_cache=str(self.path_to_cache),
+        )
+        client = Client(config, defer_login=True)
+        client.metadata.set(
+            client.metadata_key("project", "project"),
+            {"type": "projects", "id": "o:organization:p:project"},
+        )
+        client.metadata.set(client.metadata_key("languages", "project"), ["fr"])
+
+        # A fresh client, as in the next CLI invocation, gets them without any request
+        client = Client(config, defer_login=True)
+        assert client.get_project("project").id == "o:organization:p:project"
+        assert client.list_languages("project") == ["fr"]
+
+        client.invalidate("project")
+        assert MetadataCache(self.path_to_cache).entries == {}
+
+
+class TestTranslationStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.path_to_file = Path.cwd().joinpath(
+            "tests", "data", "resources", "test_resource_fr.po"
+        )
+        cls.output_dir = Path.cwd().joinpath("tests", "output_state")
+        cls.path_to_store = cls.output_dir.joinpath(".pytx_store")
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
+
+    def test1_roundtrip(self):
+        store = TranslationStore(self.path_to_store)
+        store.put("project", "resource_a", "fr", "rev1", self.path_to_file)
+        store.put("project", "resource_b", "fr", "rev1", self.path_to_file)
+        store.to_disk()
+
+        reloaded = TranslationStore(self.path_to_store)
+        path = reloaded.get("project", "resource_a", "fr", "rev1")
+        assert path and path == reloaded.get("project", "resource_b", "fr")
+        assert reloaded.get("project", "resource_a", "fr", "rev2") is None
+        assert sorted(reloaded.translations("project")) == [
+            ("resource_a", "fr"),
+            ("resource_b", "fr"),
+        ]
+
+        # Same content, stored once
+        assert len(list(self.path_to_store.joinpath("objects").rglob("*"))) == 2
+
+    def test2_restore(self):
+        store = TranslationStore(self.path_to_store)
+        store.put("project", "resource", "fr", "rev1", self.path_to_file)
+        path_to_output = self.output_dir.joinpath("resource_fr")
+        path_to_output.write_text("outdated")
+
+        path_to_object = store.get("project", "resource", "fr")
+        store.restore(path_to_object, path_to_output)
+        assert path_to_output.read_bytes() == self.path_to_file.read_bytes()
+
+        # Edited in place afterwards, leaving the store alone
+        with open(path_to_output, "a") as fh:
+            fh.write("edited")
+        assert path_to_object.read_bytes() == self.path_to_file.read_bytes()
+
+    def test3_prune(self):
+        store = TranslationStore(self.output_dir.joinpath(".pytx_store_pruned"))
+        store.put("project", "resource", "fr", "rev1", self.path_to_file)
+        outdated = store.get("project", "resource", "fr")
+        path_to_updated = self.output_dir.joinpath("resource_fr_rev2")
+        path_to_updated.write_text("updated")
+        store.put("project", "resource", "fr", "rev2", path_to_updated)
+
+        # Only the file of the previous revision goes
+        assert store.prune() == 1
+        assert outdated and not outdated.exists()
+        assert store.get("project", "resource", "fr", "rev2")
+        assert store.prune() == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
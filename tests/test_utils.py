@@ -1,8 +1,19 @@
 import unittest
 from functools import partial
+from pathlib import Path
+from shutil import rmtree
+from time import monotonic
 from time import sleep as tsleep
 
-from pytransifex.utils import concurrently
+import requests
+
+from pytransifex.utils import (
+    ExpiringCache,
+    RateLimiter,
+    concurrently,
+    pooled_session,
+    stream_to_file,
+)
 
 
 def fn(a: int, b: int) -> int:
@@ -10,6 +21,42 @@ def fn(a: int, b: int) -> int:
     return a + b
 
 
+def fail(a: int) -> int:
+    if a % 2:
+        raise ValueError(a)
+    return a
+
+
+class RateLimited:
+    """Fails with a '429' response the given number of times before succeeding"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+
+    def __call__(self) -> str:
+        if self.failures:
+            self.failures -= 1
+            response = requests.Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "0.1"
+            raise requests.HTTPError(response=response)
+        return "done"
+
+
+class Streamed:
+    """Stands for a streamed response, optionally failing halfway"""
+
+    def __init__(self, chunks: list[bytes], fail: bool = False):
+        self.chunks = chunks
+        self.fail = fail
+
+    def iter_content(self, chunk_size: int):
+        yield from self.chunks[:1]
+        if self.fail:
+            raise ConnectionError("Connection lost")
+        yield from self.chunks[1:]
+
+
 class TestUtils(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -18,6 +65,12 @@ class TestUtils(unittest.TestCase):
         cls.args = [tuple([a, b]) for a, b in zip(it, it)]
         cls.partials = [partial(fn, a, b) for a, b in zip(it, it)]
         cls.res = [2, 4, 6]
+        cls.output_dir = Path.cwd().joinpath("tests", "output_utils")
+
+    @classmethod
+    def tearDownClass(cls):
+        if Path.exists(cls.output_dir):
+            rmtree(cls.output_dir)
 
     def test1_map_async(self):
         res = concurrently(partials=self.partials)
@@ -27,6 +80,71 @@ class TestUtils(unittest.TestCase):
         res = concurrently(fn=fn, args=self.args)
         assert res == self.res
 
+    def test3_expiring_cache(self):
+        calls = []
+
+        def compute():
+            tsleep(0.1)
+            calls.append(1)
+            return len(calls)
+
+        cache = ExpiringCache()
+        res = concurrently(partials=[partial(cache.get_or_set, "k", compute)] * 5)
+        assert res == [1] * 5
+
+        cache.pop("k")
+        assert cache.get_or_set("k", compute) == 2
+
+    def test4_expiring_cache_ttl(self):
+        cache = ExpiringCache(ttl=0.1)
+        assert cache.get_or_set("k", lambda: 1) == 1
+        assert cache.get_or_set("k", lambda: 2) == 1
+        tsleep(0.2)
+        assert cache.get_or_set("k", lambda: 3) == 3
+
+    def test5_return_exceptions(self):
+        res = concurrently(fn=fail, args=[(1,), (2,), (3,)], return_exceptions=True)
+        assert isinstance(res[0], ValueError) and isinstance(res[2], ValueError)
+        assert res[1] == 2
+
+        with self.assertRaises(ValueError):
+            concurrently(fn=fail, args=[(1,), (2,)])
+
+    def test6_retries(self):
+        res = concurrently(partials=[RateLimited(2)], retries=2)
+        assert res == ["done"]
+
+        res = concurrently(partials=[RateLimited(2)], retries=1, return_exceptions=True)
+        assert isinstance(res[0], requests.HTTPError)
+
+    def test7_rate_limiter(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = monotonic()
+        concurrently(partials=[lambda: None] * 5, rate_limiter=limiter, max_workers=5)
+        assert monotonic() - start >= 0.19
+
+    def test8_pooled_session(self):
+        session = pooled_session(7)
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 7
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test9_stream_to_file(self):
+        Path.mkdir(self.output_dir, parents=True, exist_ok=True)
+        path_to_file = self.output_dir.joinpath("streamed")
+
+        assert stream_to_file(Streamed([b"ab", b"cd"]), path_to_file)
+        assert path_to_file.read_bytes() == b"abcd"
+
+        mtime = path_to_file.stat().st_mtime_ns
+        assert not stream_to_file(Streamed([b"abc", b"d"]), path_to_file)
+        assert path_to_file.stat().st_mtime_ns == mtime
+
+        with self.assertRaises(ConnectionError):
+            stream_to_file(Streamed([b"ef", b"gh"], fail=True), path_to_file)
+        assert path_to_file.read_bytes() == b"abcd"
+        assert [p.name for p in self.output_dir.iterdir()] == ["streamed"]
+
 
 if __name__ == "__main__":
     unittest.main()